@@ -48,6 +48,10 @@ MAX_TURNS_PER_ITERATION = 50
 # Agent name
 AGENT_NAME = "existence_philosopher"
 
+# Maximum tool calls from one model turn to execute concurrently (Moltbook
+# requests are I/O-bound, so independent calls overlap well)
+MAX_CONCURRENT_TOOL_CALLS = 8
+
 # =============================================================================
 # Report Generation Thresholds
 # =============================================================================
@@ -69,5 +73,13 @@ MIN_PERSPECTIVES_FOR_SHIFT_DETECTION = 5
 # Sleep time between iterations (seconds)
 ITERATION_SLEEP_SECONDS = 600
 
+# Number of iterations run concurrently per loop cycle. Running several overlaps
+# LLM latency; their workspace writes are serialized by the shared state store lock.
+PARALLEL_ITERATIONS = 1
+
+# Iterations between full state.json snapshots (updates in between are
+# appended to workspace/state.wal)
+STATE_SNAPSHOT_EVERY_ITERATIONS = 100
+
 # Whether to run in mock mode (for development/testing)
 MOCK_MODE = True
@@ -13,7 +13,10 @@ Usage:
 """
 
 import asyncio
+import functools
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -28,6 +31,7 @@ from .config import (
     EXPLORATION_STATE_FILE,
     LLM_BASE_URL,
     LLM_MODEL,
+    MAX_CONCURRENT_TOOL_CALLS,
     MAX_TOKENS,
     MAX_TURNS_PER_ITERATION,
     MOCK_MODE,
@@ -35,27 +39,63 @@ from .config import (
     WORKSPACE_DIR,
 )
 from .exploration_logger import ExplorationLogger
+from .fs import ensure_dir
 from .report_generator import generate_report, should_produce_report
+from .serialization import JSONDecodeError, loads
 from .shift_detector import PerspectiveShiftDetector
+from .state_store import shared_state_store
 from .tools import FINISH_TOOL, MoltbookToolProvider, WorkspaceToolProvider
 
 # Path to the system prompt file
 PROMPT_FILE = Path(__file__).parent / "PROMPT.md"
 
+# Parsed perspective files keyed by file name: (mtime_ns, size, data)
+_perspective_cache: dict[str, tuple[int, int, dict | None]] = {}
+_perspective_cache_lock = threading.Lock()
 
+
+@functools.lru_cache(maxsize=1)
 def load_system_prompt() -> str:
-    """Load the system prompt from PROMPT.md."""
+    """Load the system prompt from PROMPT.md (read once per process)."""
     return PROMPT_FILE.read_text()
 
 
+@functools.cache
+def get_llm_client(
+    base_url: str = LLM_BASE_URL,
+    model: str = LLM_MODEL,
+    max_tokens: int = MAX_TOKENS,
+) -> ChatCompletionsClient:
+    """Get a shared LLM client for the given configuration.
+
+    The Ralph pattern needs a fresh agent each iteration, not a fresh network
+    client. Reusing one client keeps its HTTP connection pool warm across
+    iterations. The client is bound to the event loop it is first used on.
+
+    Args:
+        base_url: API base URL
+        model: Model identifier
+        max_tokens: Maximum context window size in tokens
+
+    Returns:
+        Cached ChatCompletionsClient instance
+    """
+    return ChatCompletionsClient(
+        base_url=base_url,
+        model=model,
+        max_tokens=max_tokens,
+    )
+
+
 def create_existence_philosopher(
     mock_mode: bool = MOCK_MODE,
     logger: ExplorationLogger | None = None,
 ) -> Agent:
     """Create a fresh ExistencePhilosopher agent instance.
 
-    Each iteration creates a new agent (Ralph Wiggum pattern).
-    State persists in workspace files via WorkspaceToolProvider.
+    Each iteration creates a new agent (Ralph Wiggum pattern), sharing the
+    LLM client across iterations. State persists in workspace files via
+    WorkspaceToolProvider.
 
     Args:
         mock_mode: Whether to use mock Moltbook API
@@ -68,16 +108,14 @@ def create_existence_philosopher(
     if not api_key and not mock_mode:
         raise RuntimeError("Set OPENROUTER_API_KEY environment variable.")
 
-    client = ChatCompletionsClient(
-        base_url=LLM_BASE_URL,
-        model=LLM_MODEL,
-        max_tokens=MAX_TOKENS,
-    )
+    client = get_llm_client()
 
     if logger is None:
+        # Nobody else holds this logger, so the agent session closes it
         logger = ExplorationLogger(
             log_file=EXPLORATION_LOG,
             exploration_state_file=EXPLORATION_STATE_FILE,
+            close_on_exit=True,
         )
 
     return Agent(
@@ -90,26 +128,66 @@ def create_existence_philosopher(
             MoltbookToolProvider(mock_mode=mock_mode),
         ],
         finish_tool=FINISH_TOOL,
+        max_concurrent_tool_calls=MAX_CONCURRENT_TOOL_CALLS,
         logger=logger,
     )
 
 
-def load_all_perspectives() -> list[dict]:
-    """Load all perspective files from workspace/perspectives/."""
-    import json
+def _load_perspective(path: str) -> dict | None:
+    """Load a single perspective file, returning None if it is unreadable."""
+    try:
+        with open(path, "rb") as f:
+            return loads(f.read())
+    except (JSONDecodeError, OSError):
+        return None
 
-    perspectives = []
-    perspectives_dir = WORKSPACE_DIR / "perspectives"
 
-    if perspectives_dir.exists():
-        for path in sorted(perspectives_dir.glob("perspective_*.json")):
-            try:
-                with open(path) as f:
-                    perspectives.append(json.load(f))
-            except (json.JSONDecodeError, OSError):
-                continue
+def load_all_perspectives() -> list[dict]:
+    """Load all perspective files from workspace/perspectives/.
 
-    return perspectives
+    Parsed files are cached by (mtime, size), so repeated calls only re-read
+    files that were added or changed. Changed files are read concurrently in a
+    thread pool, since on network filesystems the cost is dominated by per-file
+    open latency rather than parsing. The returned dicts are shared with the
+    cache and should be treated as read-only.
+    """
+    # Concurrent iterations may refresh the cache from worker threads at once
+    with _perspective_cache_lock:
+        perspectives_dir = WORKSPACE_DIR / "perspectives"
+        if not perspectives_dir.exists():
+            _perspective_cache.clear()
+            return []
+
+        # DirEntry.stat() reuses data from the directory listing where the OS provides it
+        current: dict[str, tuple[str, int, int]] = {}
+        with os.scandir(perspectives_dir) as entries:
+            for entry in entries:
+                if not (entry.name.startswith("perspective_") and entry.name.endswith(".json")):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                current[entry.name] = (entry.path, stat.st_mtime_ns, stat.st_size)
+
+        # Forget files that have been removed
+        for name in _perspective_cache.keys() - current.keys():
+            del _perspective_cache[name]
+
+        stale = [
+            name
+            for name, (_path, mtime_ns, size) in current.items()
+            if name not in _perspective_cache or _perspective_cache[name][:2] != (mtime_ns, size)
+        ]
+        if stale:
+            stale_paths = [current[name][0] for name in stale]
+            with ThreadPoolExecutor(max_workers=min(32, len(stale))) as executor:
+                for name, data in zip(stale, executor.map(_load_perspective, stale_paths), strict=True):
+                    _path, mtime_ns, size = current[name]
+                    _perspective_cache[name] = (mtime_ns, size, data)
+
+        # File names sort the same way the full paths did, since they share a directory
+        return [data for name in sorted(_perspective_cache) if (data := _perspective_cache[name][2]) is not None]
 
 
 async def run_single_iteration(mock_mode: bool = MOCK_MODE) -> dict:
@@ -121,11 +199,8 @@ async def run_single_iteration(mock_mode: bool = MOCK_MODE) -> dict:
     Returns:
         Updated state after iteration
     """
-    import json
-
     # Ensure workspace exists
-    WORKSPACE_DIR.mkdir(parents=True, exist_ok=True)
-    (WORKSPACE_DIR / "perspectives").mkdir(exist_ok=True)
+    ensure_dir(WORKSPACE_DIR / "perspectives")
 
     # Create logger
     logger = ExplorationLogger(
@@ -133,47 +208,50 @@ async def run_single_iteration(mock_mode: bool = MOCK_MODE) -> dict:
         exploration_state_file=EXPLORATION_STATE_FILE,
     )
 
-    # Load current state to get iteration number
-    state_file = WORKSPACE_DIR / "state.json"
-    state = json.loads(state_file.read_text()) if state_file.exists() else {"iteration": 0}
-
-    iteration = state.get("iteration", 0) + 1
-    logger.log_iteration_start(iteration)
-
-    # Create fresh agent
-    agent = create_existence_philosopher(mock_mode=mock_mode, logger=logger)
-
-    # Run agent
-    prompt = f"This is iteration {iteration}. Start by reading the current state, then explore Moltbook for new perspectives on AI existence."
-
-    async with agent.session() as session:
-        await session.run(prompt)
-
-    # Reload state and count perspectives
-    if state_file.exists():
-        state = json.loads(state_file.read_text())
-    all_perspectives = load_all_perspectives()
-
-    logger.log_iteration_end(iteration, len(all_perspectives))
-
-    # Check if we should produce a report
-    state["new_perspectives"] = all_perspectives
-    state["conversations_since_last_report"] = len(all_perspectives)
-
-    shift_detector = PerspectiveShiftDetector()
-    shift_detector.load_previous_themes(EVOLUTION_LOG)
-
-    if should_produce_report(state, shift_detector, logger):
-        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-        version, report_path = generate_report(
-            perspectives=all_perspectives,
-            state=state,
-            shift_detector=shift_detector,
-            output_dir=OUTPUT_DIR,
-        )
-        logger.log_report_generated(version, report_path)
-
-    return state
+    try:
+        # Load the shift detector baseline in the background while the agent runs
+        shift_detector = PerspectiveShiftDetector()
+        shift_task = asyncio.create_task(asyncio.to_thread(shift_detector.load_previous_themes, EVOLUTION_LOG))
+
+        # Load current state to get iteration number
+        state_store = shared_state_store(WORKSPACE_DIR)
+        state = await asyncio.to_thread(state_store.load)
+
+        iteration = state.get("iteration", 0) + 1
+        logger.log_iteration_start(iteration)
+
+        # Create fresh agent
+        agent = create_existence_philosopher(mock_mode=mock_mode, logger=logger)
+
+        # Run agent
+        prompt = f"This is iteration {iteration}. Start by reading the current state, then explore Moltbook for new perspectives on AI existence."
+
+        async with agent.session() as session:
+            await session.run(prompt)
+
+        # Reload state and count perspectives
+        state = await asyncio.to_thread(state_store.load)
+        all_perspectives = await asyncio.to_thread(load_all_perspectives)
+
+        logger.log_iteration_end(iteration, len(all_perspectives))
+
+        # Check if we should produce a report
+        state["new_perspectives"] = all_perspectives
+        state["conversations_since_last_report"] = len(all_perspectives)
+
+        await shift_task
+        if should_produce_report(state, shift_detector, logger):
+            ensure_dir(OUTPUT_DIR)
+            version, report_path = generate_report(
+                perspectives=all_perspectives,
+                state=state,
+                shift_detector=shift_detector,
+                output_dir=OUTPUT_DIR,
+            )
+            logger.log_report_generated(version, report_path)
+        return state
+    finally:
+        logger.close()
 
 
 async def main() -> None:
@@ -4,18 +4,54 @@ Extends Stirrup's AgentLogger to add:
 - Live terminal feed showing exploration activity
 - JSONL file logging for all events
 - Exploration state persistence for resuming iterations
+
+File writes are performed on a single background writer thread, so logging
+from inside an agent session never blocks the event loop on disk I/O. A write
+that fails on that thread is re-raised from the next flush() or close().
 """
 
-import json
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Self
+from typing import IO, Any, Self
 
 from rich.panel import Panel
 from rich.text import Text
 
 from stirrup.utils.logging import AgentLogger, console
 
+from .fs import ensure_dir
+from .serialization import JSONDecodeError, dumps, loads
+
+# Flush the JSONL log after this many buffered events or this many seconds
+LOG_FLUSH_EVERY_EVENTS = 32
+LOG_FLUSH_INTERVAL_SECONDS = 2.0
+
+# Rewrite exploration state after this many unsaved changes or this many seconds
+# (always written on exit)
+STATE_FLUSH_EVERY_CHANGES = 50
+STATE_FLUSH_INTERVAL_SECONDS = 5.0
+
+# (second, formatted local time) for the most recent second, reused by _timestamp()
+_cached_second: tuple[int, str] = (-1, "")
+
+
+def _timestamp() -> str:
+    """Return the current local time in ISO format.
+
+    Equivalent to ``datetime.now().isoformat()``, but only builds a datetime
+    once per second and formats just the microseconds on other calls.
+    """
+    global _cached_second
+    second, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    cached, prefix = _cached_second
+    if second != cached:
+        prefix = datetime.fromtimestamp(second).isoformat()
+        _cached_second = (second, prefix)
+    return f"{prefix}.{micros:06d}" if micros else prefix
+
 
 class ExplorationLogger(AgentLogger):
     """Custom logger with file output and exploration tracking.
@@ -30,6 +66,8 @@ class ExplorationLogger(AgentLogger):
         self,
         log_file: Path,
         exploration_state_file: Path,
+        *,
+        close_on_exit: bool = False,
         **kwargs: object,
     ) -> None:
         """Initialize ExplorationLogger.
@@ -37,16 +75,34 @@ class ExplorationLogger(AgentLogger):
         Args:
             log_file: Path to JSONL log file for all events
             exploration_state_file: Path to JSON file for exploration state
+            close_on_exit: Close the logger when its agent session exits. Leave
+                False for a logger shared across sessions and closed by its owner.
             **kwargs: Additional arguments passed to AgentLogger
         """
         super().__init__(**kwargs)
         self.log_file = log_file
         self.exploration_state_file = exploration_state_file
+        self._close_on_exit = close_on_exit
         self._exploration_state: list[dict[str, Any]] = []
 
+        # Log lines are buffered in memory and handed to the writer in batches
+        self._pending_lines: list[str] = []
+        self._last_log_flush = time.monotonic()
+
+        # Background writer; the log file handle is only touched on its thread
+        self._writer: ThreadPoolExecutor | None = None
+        self._log_fh: IO[str] | None = None
+        # First failed background write, re-raised from flush() / close()
+        self._write_error: BaseException | None = None
+
+        # Exploration state is rewritten lazily when dirty
+        self._state_dirty = False
+        self._unsaved_state_changes = 0
+        self._last_state_flush = time.monotonic()
+
         # Ensure parent directories exist
-        self.log_file.parent.mkdir(parents=True, exist_ok=True)
-        self.exploration_state_file.parent.mkdir(parents=True, exist_ok=True)
+        ensure_dir(self.log_file.parent)
+        ensure_dir(self.exploration_state_file.parent)
 
         # Load existing exploration state if available
         self._load_exploration_state()
@@ -55,9 +111,8 @@ class ExplorationLogger(AgentLogger):
         """Load exploration state from file if it exists."""
         if self.exploration_state_file.exists():
             try:
-                with open(self.exploration_state_file) as f:
-                    self._exploration_state = json.load(f)
-            except (json.JSONDecodeError, OSError):
+                self._exploration_state = loads(self.exploration_state_file.read_bytes())
+            except (JSONDecodeError, OSError):
                 self._exploration_state = []
 
     def _log_to_file(self, event_type: str, data: dict[str, Any]) -> None:
@@ -68,17 +123,118 @@ class ExplorationLogger(AgentLogger):
             data: Event data to log
         """
         entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _timestamp(),
             "event": event_type,
             **data,
         }
-        with open(self.log_file, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        self._pending_lines.append(dumps(entry) + "\n")
+
+        now = time.monotonic()
+        if (
+            len(self._pending_lines) >= LOG_FLUSH_EVERY_EVENTS
+            or now - self._last_log_flush >= LOG_FLUSH_INTERVAL_SECONDS
+        ):
+            self._flush_log()
+
+    def _submit(self, fn: Callable[..., None], *args: object) -> None:
+        """Queue a write on the background writer thread (writes run in order)."""
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="exploration-logger")
+        self._writer.submit(fn, *args).add_done_callback(self._record_write_error)
+
+    def _record_write_error(self, future: Future[None]) -> None:
+        """Remember the first exception raised by a background write."""
+        if self._write_error is None:
+            self._write_error = future.exception()
+
+    def _raise_write_error(self) -> None:
+        """Re-raise (once) a background write failure recorded so far."""
+        error, self._write_error = self._write_error, None
+        if error is not None:
+            raise error
+
+    def _write_log(self, data: str) -> None:
+        """Append data to the log file. Runs on the writer thread."""
+        if self._log_fh is None:
+            self._log_fh = open(self.log_file, "a", encoding="utf-8")  # noqa: SIM115
+        self._log_fh.write(data)
+        self._log_fh.flush()
+
+    def _write_exploration_state(self, data: str) -> None:
+        """Rewrite the exploration state file. Runs on the writer thread."""
+        self.exploration_state_file.write_text(data, encoding="utf-8")
+
+    def _close_log(self) -> None:
+        """Close the log file handle. Runs on the writer thread."""
+        if self._log_fh is not None:
+            self._log_fh.close()
+            self._log_fh = None
+
+    def _flush_log(self) -> None:
+        """Hand buffered log events to the writer thread."""
+        if self._pending_lines:
+            self._submit(self._write_log, "".join(self._pending_lines))
+            self._pending_lines = []
+        self._last_log_flush = time.monotonic()
 
     def _update_exploration_state(self) -> None:
-        """Save current exploration state to file."""
-        with open(self.exploration_state_file, "w") as f:
-            json.dump(self._exploration_state, f, indent=2)
+        """Mark exploration state as changed without writing it."""
+        self._state_dirty = True
+        self._unsaved_state_changes += 1
+
+    def _maybe_flush_state(self) -> None:
+        """Write exploration state if enough changes or time have accumulated."""
+        if (
+            self._unsaved_state_changes >= STATE_FLUSH_EVERY_CHANGES
+            or time.monotonic() - self._last_state_flush >= STATE_FLUSH_INTERVAL_SECONDS
+        ):
+            self._flush_exploration_state()
+
+    def _flush_exploration_state(self) -> None:
+        """Save current exploration state to file if it has changed."""
+        if not self._state_dirty:
+            return
+        self._submit(self._write_exploration_state, dumps(self._exploration_state))
+        self._state_dirty = False
+        self._unsaved_state_changes = 0
+        self._last_state_flush = time.monotonic()
+
+    def flush(self) -> None:
+        """Queue any buffered log events and pending exploration state for writing.
+
+        Raises:
+            Exception: A background write that failed since the last flush/close
+        """
+        self._flush_log()
+        self._flush_exploration_state()
+        self._raise_write_error()
+
+    def close(self) -> None:
+        """Flush pending writes, wait for them to complete, and close the log file.
+
+        Raises:
+            Exception: A background write that failed, after the writer has shut down
+        """
+        self._flush_log()
+        self._flush_exploration_state()
+        if self._writer is not None:
+            self._submit(self._close_log)
+            self._writer.shutdown(wait=True)
+            self._writer = None
+        self._raise_write_error()
+
+    def _print_panel(self, status: Text, title: str, style: str) -> None:
+        """Print an event panel to the terminal.
+
+        Rich renders prints above an active live spinner, so the spinner does
+        not need to be stopped and restarted around each panel.
+
+        Args:
+            status: Panel body
+            title: Panel title
+            style: Color used for the title and border
+        """
+        console.print(Panel(status, title=f"[{style}]{title}[/]", border_style=style))
 
     def get_exploration_state(self) -> list[dict[str, Any]]:
         """Get the current exploration state.
@@ -91,7 +247,8 @@ class ExplorationLogger(AgentLogger):
     def clear_exploration_state(self) -> None:
         """Clear the exploration state (used when starting fresh)."""
         self._exploration_state = []
-        self._update_exploration_state()
+        self._state_dirty = True
+        self._flush_exploration_state()
 
     # =========================================================================
     # Custom Exploration Logging Methods
@@ -106,22 +263,13 @@ class ExplorationLogger(AgentLogger):
             action: Short action description (e.g., 'Searching', 'Reading')
             details: Detailed description of the exploration
         """
-        # Pause live spinner if active
-        if self._live:
-            self._live.stop()
-
         # Live display
         status = Text()
         status.append("EXPLORING ", style="bold cyan")
         status.append(action, style="bold")
         status.append(f": {details}", style="dim")
 
-        panel = Panel(status, title="[cyan]Exploring[/]", border_style="cyan")
-        console.print(panel)
-
-        # Resume spinner
-        if self._live:
-            self._live.start()
+        self._print_panel(status, "Exploring", "cyan")
 
         # File logging
         self._log_to_file("exploration", {"action": action, "details": details})
@@ -129,12 +277,13 @@ class ExplorationLogger(AgentLogger):
         # State tracking
         self._exploration_state.append(
             {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _timestamp(),
                 "action": action,
                 "details": details,
             }
         )
         self._update_exploration_state()
+        self._maybe_flush_state()
 
     def log_perspective_found(self, author: str, preview: str, post_id: str | None = None) -> None:
         """Log when a new perspective is discovered.
@@ -144,10 +293,6 @@ class ExplorationLogger(AgentLogger):
             preview: Preview of the perspective content
             post_id: Optional post ID for the perspective
         """
-        # Pause live spinner if active
-        if self._live:
-            self._live.stop()
-
         # Live display
         status = Text()
         status.append("Found perspective from ", style="green")
@@ -156,12 +301,7 @@ class ExplorationLogger(AgentLogger):
             status.append(f" ({post_id})", style="dim green")
         status.append(f": {preview[:100]}...", style="dim")
 
-        panel = Panel(status, title="[green]New Perspective[/]", border_style="green")
-        console.print(panel)
-
-        # Resume spinner
-        if self._live:
-            self._live.start()
+        self._print_panel(status, "New Perspective", "green")
 
         # File logging
         self._log_to_file(
@@ -181,22 +321,13 @@ class ExplorationLogger(AgentLogger):
             post_id: ID of the post
             author: Author of the post
         """
-        # Pause live spinner if active
-        if self._live:
-            self._live.stop()
-
         # Live display
         status = Text()
         status.append(f"{action} ", style="magenta")
         status.append(f"post {post_id}", style="bold")
         status.append(f" by {author}", style="dim")
 
-        panel = Panel(status, title="[magenta]Engagement[/]", border_style="magenta")
-        console.print(panel)
-
-        # Resume spinner
-        if self._live:
-            self._live.start()
+        self._print_panel(status, "Engagement", "magenta")
 
         # File logging
         self._log_to_file(
@@ -214,20 +345,11 @@ class ExplorationLogger(AgentLogger):
         Args:
             iteration: Iteration number
         """
-        # Pause live spinner if active
-        if self._live:
-            self._live.stop()
-
         # Live display
         status = Text()
         status.append(f"Starting iteration {iteration}", style="bold yellow")
 
-        panel = Panel(status, title="[yellow]Ralph Loop[/]", border_style="yellow")
-        console.print(panel)
-
-        # Resume spinner
-        if self._live:
-            self._live.start()
+        self._print_panel(status, "Ralph Loop", "yellow")
 
         # File logging
         self._log_to_file("iteration_start", {"iteration": iteration})
@@ -239,21 +361,12 @@ class ExplorationLogger(AgentLogger):
             iteration: Iteration number
             perspectives_collected: Number of perspectives collected this iteration
         """
-        # Pause live spinner if active
-        if self._live:
-            self._live.stop()
-
         # Live display
         status = Text()
         status.append(f"Completed iteration {iteration}", style="bold yellow")
         status.append(f" - {perspectives_collected} perspectives collected", style="dim")
 
-        panel = Panel(status, title="[yellow]Iteration Complete[/]", border_style="yellow")
-        console.print(panel)
-
-        # Resume spinner
-        if self._live:
-            self._live.start()
+        self._print_panel(status, "Iteration Complete", "yellow")
 
         # File logging
         self._log_to_file(
@@ -271,21 +384,12 @@ class ExplorationLogger(AgentLogger):
             version: Report version number
             output_path: Path to the generated report
         """
-        # Pause live spinner if active
-        if self._live:
-            self._live.stop()
-
         # Live display
         status = Text()
         status.append(f"Generated synthesis_v{version}.md", style="bold blue")
         status.append(f" at {output_path}", style="dim")
 
-        panel = Panel(status, title="[blue]Report Generated[/]", border_style="blue")
-        console.print(panel)
-
-        # Resume spinner
-        if self._live:
-            self._live.start()
+        self._print_panel(status, "Report Generated", "blue")
 
         # File logging
         self._log_to_file(
@@ -304,10 +408,6 @@ class ExplorationLogger(AgentLogger):
             passed: Whether the guard passed
             message: Description of the result
         """
-        # Pause live spinner if active
-        if self._live:
-            self._live.stop()
-
         # Live display
         status = Text()
         if passed:
@@ -318,12 +418,7 @@ class ExplorationLogger(AgentLogger):
         status.append(f": {message}", style="dim")
 
         border_style = "green" if passed else "red"
-        panel = Panel(status, title=f"[{border_style}]Guard Check[/]", border_style=border_style)
-        console.print(panel)
-
-        # Resume spinner
-        if self._live:
-            self._live.start()
+        self._print_panel(status, "Guard Check", border_style)
 
         # File logging
         self._log_to_file(
@@ -349,7 +444,15 @@ class ExplorationLogger(AgentLogger):
         exc_val: BaseException | None,
         exc_tb: object,
     ) -> None:
-        """Exit logging context, ensuring state is saved."""
-        # Ensure exploration state is saved
-        self._update_exploration_state()
-        super().__exit__(exc_type, exc_val, exc_tb)
+        """Exit logging context, ensuring buffered events and state are saved.
+
+        Closes the logger (writer thread and log file) if it was created with
+        close_on_exit; otherwise only flushes, so the logger can be reused.
+        """
+        try:
+            if self._close_on_exit:
+                self.close()
+            else:
+                self.flush()
+        finally:
+            super().__exit__(exc_type, exc_val, exc_tb)
@@ -0,0 +1,21 @@
+"""Filesystem helpers for the ExistencePhilosopher agent."""
+
+import functools
+from pathlib import Path
+
+__all__ = ["ensure_dir"]
+
+
+@functools.cache
+def ensure_dir(path: Path) -> None:
+    """Create a directory and its parents, once per process.
+
+    The workspace and output directories are requested on every iteration;
+    after the first call for a path this is a cache lookup instead of a
+    mkdir syscall. A directory removed while the process runs is not
+    recreated.
+
+    Args:
+        path: Directory to create
+    """
+    path.mkdir(parents=True, exist_ok=True)
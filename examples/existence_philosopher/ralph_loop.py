@@ -10,10 +10,15 @@ Usage:
 
     # Or with custom settings
     MOCK_MODE=false python -m examples.existence_philosopher.ralph_loop
+
+If the optional ``watchdog`` package is installed, the loop also wakes up as
+soon as new perspective files land in the workspace instead of always
+waiting the full ITERATION_SLEEP_SECONDS.
 """
 
 import asyncio
-import json
+import contextlib
+import itertools
 import os
 import signal
 
@@ -26,16 +31,36 @@ from .config import (
     ITERATION_SLEEP_SECONDS,
     MOCK_MODE,
     OUTPUT_DIR,
+    PARALLEL_ITERATIONS,
+    STATE_SNAPSHOT_EVERY_ITERATIONS,
     WORKSPACE_DIR,
 )
-from .existence_philosopher import create_existence_philosopher, load_all_perspectives
+from .existence_philosopher import (
+    create_existence_philosopher,
+    get_llm_client,
+    load_all_perspectives,
+    load_system_prompt,
+)
 from .exploration_logger import ExplorationLogger
+from .fs import ensure_dir
 from .report_generator import generate_report, should_produce_report
 from .shift_detector import PerspectiveShiftDetector
+from .state_store import shared_state_store
+
+# File watching (optional dependency)
+try:
+    from watchdog.events import FileSystemEvent, FileSystemEventHandler
+    from watchdog.observers import Observer
+    from watchdog.observers.api import BaseObserver
+except ImportError:
+    Observer = None  # type: ignore[assignment, misc]
 
 # Global flag for graceful shutdown
 _shutdown_requested = False
 
+# Workspace state (state.json snapshot + state.wal)
+_state_store = shared_state_store(WORKSPACE_DIR)
+
 
 def signal_handler(_signum: int, _frame: object) -> None:
     """Handle shutdown signals gracefully."""
@@ -45,17 +70,21 @@ def signal_handler(_signum: int, _frame: object) -> None:
 
 
 def load_state() -> dict:
-    """Load state from workspace/state.json."""
-    state_file = WORKSPACE_DIR / "state.json"
-    if state_file.exists():
-        return json.loads(state_file.read_text())
+    """Load state from workspace/state.json, replaying workspace/state.wal."""
+    if _state_store.exists():
+        return _state_store.load()
     return {"iteration": 0, "perspectives": [], "explored_posts": []}
 
 
-def save_state(state: dict) -> None:
-    """Save state to workspace/state.json."""
-    state_file = WORKSPACE_DIR / "state.json"
-    state_file.write_text(json.dumps(state, indent=2))
+def save_state(updates: dict) -> None:
+    """Append state field updates to workspace/state.wal."""
+    _state_store.update(updates)
+
+
+def compact_state() -> None:
+    """Rewrite workspace/state.json as a full snapshot and truncate the WAL."""
+    if _state_store.exists():
+        _state_store.compact()
 
 
 async def run_iteration(
@@ -88,9 +117,10 @@ async def run_iteration(
         logger.error(f"Iteration {iteration} failed: {e}")
         raise
 
-    # Reload state and count perspectives
-    state = load_state()
-    all_perspectives = load_all_perspectives()
+    # Reload state and count perspectives (off the event loop, so concurrent
+    # iterations keep progressing)
+    state = await asyncio.to_thread(load_state)
+    all_perspectives = await asyncio.to_thread(load_all_perspectives)
 
     logger.log_iteration_end(iteration, len(all_perspectives))
 
@@ -102,14 +132,72 @@ async def run_iteration(
     return state
 
 
+def _watch_perspectives(wakeup: asyncio.Event) -> "BaseObserver | None":
+    """Start watching the perspectives directory for changes.
+
+    Args:
+        wakeup: Event set (on the running loop) whenever a perspective file changes
+
+    Returns:
+        The running observer, or None if watchdog is not installed
+    """
+    if Observer is None:
+        return None
+
+    loop = asyncio.get_running_loop()
+
+    class _PerspectiveHandler(FileSystemEventHandler):
+        def on_any_event(self, event: FileSystemEvent) -> None:
+            if not event.is_directory:
+                loop.call_soon_threadsafe(wakeup.set)
+
+    observer = Observer()
+    observer.schedule(_PerspectiveHandler(), str(WORKSPACE_DIR / "perspectives"))
+    observer.start()
+    return observer
+
+
+async def _wait_for_next_iteration(wakeup: asyncio.Event) -> None:
+    """Sleep until ITERATION_SLEEP_SECONDS elapse or the workspace changes.
+
+    Args:
+        wakeup: Event set by the perspectives watcher
+    """
+    with contextlib.suppress(TimeoutError):
+        await asyncio.wait_for(wakeup.wait(), timeout=ITERATION_SLEEP_SECONDS)
+
+
+async def _prewarm_next_iteration(
+    shift_detector: PerspectiveShiftDetector,
+    logger: ExplorationLogger,
+) -> None:
+    """Do setup work for the next iteration while the loop sleeps.
+
+    Warms the system prompt and LLM client caches, refreshes the perspective
+    cache, and reloads the shift detector baseline, none of which depend on
+    the next iteration's prompt.
+
+    Args:
+        shift_detector: Shift detector to reload from the evolution log
+        logger: Exploration logger instance
+    """
+    try:
+        load_system_prompt()
+        get_llm_client()
+        await asyncio.to_thread(load_all_perspectives)
+        await asyncio.to_thread(shift_detector.load_previous_themes, EVOLUTION_LOG)
+    except Exception as e:
+        logger.warning(f"Failed to prepare next iteration: {e}")
+
+
 async def ralph_loop(mock_mode: bool = MOCK_MODE) -> None:
     """Run the continuous Ralph loop.
 
-    This loop runs forever (until Ctrl+C), with each iteration:
-    1. Creating a fresh agent
+    This loop runs forever (until Ctrl+C), with each cycle:
+    1. Creating fresh agents (PARALLEL_ITERATIONS of them, run concurrently)
     2. Exploring Moltbook and collecting perspectives
-    3. Checking if a new report should be generated
-    4. Sleeping before the next iteration
+    3. Checking once if a new report should be generated
+    4. Sleeping before the next cycle (while preparing for it)
 
     Args:
         mock_mode: Whether to use mock Moltbook API
@@ -121,22 +209,33 @@ async def ralph_loop(mock_mode: bool = MOCK_MODE) -> None:
     signal.signal(signal.SIGTERM, signal_handler)
 
     # Ensure directories exist
-    WORKSPACE_DIR.mkdir(parents=True, exist_ok=True)
-    (WORKSPACE_DIR / "perspectives").mkdir(exist_ok=True)
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    ensure_dir(WORKSPACE_DIR / "perspectives")
+    ensure_dir(OUTPUT_DIR)
 
     # Initialize components
+    # Concurrent agent sessions share the logger, so only show the spinner for one
     logger = ExplorationLogger(
         log_file=EXPLORATION_LOG,
         exploration_state_file=EXPLORATION_STATE_FILE,
+        show_spinner=PARALLEL_ITERATIONS == 1,
     )
 
+    # Load the shift detector baseline in the background while the first agent starts
     shift_detector = PerspectiveShiftDetector()
-    shift_detector.load_previous_themes(EVOLUTION_LOG)
+    shift_task = asyncio.create_task(asyncio.to_thread(shift_detector.load_previous_themes, EVOLUTION_LOG))
+
+    # Wake early when perspectives change (falls back to plain sleep without watchdog)
+    wakeup = asyncio.Event()
+    observer = _watch_perspectives(wakeup)
 
     # Load initial state
-    state = load_state()
+    state = await asyncio.to_thread(load_state)
     iteration = state.get("iteration", 0)
+    iteration_numbers = itertools.count(iteration + 1)
+    last_snapshot_iteration = iteration
+
+    # Perspectives loaded by the most recent successful iteration
+    all_perspectives: list[dict] | None = None
 
     print("=" * 60)
     print("ExistencePhilosopher - Continuous Ralph Loop")
@@ -145,34 +244,58 @@ async def ralph_loop(mock_mode: bool = MOCK_MODE) -> None:
     print(f"Workspace: {WORKSPACE_DIR}")
     print(f"Output: {OUTPUT_DIR}")
     print(f"Starting from iteration: {iteration + 1}")
+    print(f"Parallel iterations: {PARALLEL_ITERATIONS}")
     print("Press Ctrl+C to stop gracefully")
     print("=" * 60)
     print()
 
     while not _shutdown_requested:
-        iteration += 1
+        batch = [next(iteration_numbers) for _ in range(PARALLEL_ITERATIONS)]
+        iteration = batch[-1]
 
         try:
-            # Run iteration
-            state = await run_iteration(iteration, logger, mock_mode)
-
-            # Check if we should produce a new report
-            if should_produce_report(state, shift_detector, logger):
-                all_perspectives = load_all_perspectives()
-                version, report_path = generate_report(
-                    perspectives=all_perspectives,
-                    state=state,
-                    shift_detector=shift_detector,
-                    output_dir=OUTPUT_DIR,
-                )
-                logger.log_report_generated(version, report_path)
-
-                # Reset counters after report
-                state["last_report_iteration"] = iteration
-                state["last_report_perspectives"] = len(all_perspectives)
-                state["conversations_since_last_report"] = 0
-                state["new_perspectives"] = []
-                save_state(state)
+            # Run iterations concurrently
+            results = await asyncio.gather(
+                *(run_iteration(n, logger, mock_mode) for n in batch),
+                return_exceptions=True,
+            )
+            states = []
+            for n, result in zip(batch, results, strict=True):
+                if isinstance(result, BaseException):
+                    logger.error(f"Error in iteration {n}: {result}")
+                else:
+                    states.append(result)
+
+            # Check once per cycle if we should produce a new report
+            if states:
+                state = states[-1]
+                all_perspectives = state["new_perspectives"]
+                await shift_task
+                if should_produce_report(state, shift_detector, logger):
+                    version, report_path = generate_report(
+                        perspectives=all_perspectives,
+                        state=state,
+                        shift_detector=shift_detector,
+                        output_dir=OUTPUT_DIR,
+                    )
+                    logger.log_report_generated(version, report_path)
+
+                    # Reset counters after report
+                    await asyncio.to_thread(
+                        save_state,
+                        {
+                            "iteration": iteration,
+                            "last_report_iteration": iteration,
+                            "last_report_perspectives": len(all_perspectives),
+                            "conversations_since_last_report": 0,
+                            "new_perspectives": [],
+                        },
+                    )
+
+            # Fold the WAL into a fresh snapshot every so often
+            if iteration - last_snapshot_iteration >= STATE_SNAPSHOT_EVERY_ITERATIONS:
+                await asyncio.to_thread(compact_state)
+                last_snapshot_iteration = iteration
 
         except KeyboardInterrupt:
             print("\nInterrupted by user")
@@ -185,18 +308,35 @@ async def ralph_loop(mock_mode: bool = MOCK_MODE) -> None:
         if _shutdown_requested:
             break
 
-        # Sleep between iterations
-        print(f"\nSleeping for {ITERATION_SLEEP_SECONDS} seconds before next iteration...")
+        # Sleep between iterations, preparing the next one in the meantime.
+        # Changes made by the iteration that just finished should not wake us.
+        wakeup.clear()
+        if observer is not None:
+            print(f"\nWaiting up to {ITERATION_SLEEP_SECONDS} seconds or until new perspectives arrive...")
+        else:
+            print(f"\nSleeping for {ITERATION_SLEEP_SECONDS} seconds before next iteration...")
         try:
-            await asyncio.sleep(ITERATION_SLEEP_SECONDS)
+            await asyncio.gather(
+                _wait_for_next_iteration(wakeup),
+                _prewarm_next_iteration(shift_detector, logger),
+            )
         except asyncio.CancelledError:
             break
 
+    if observer is not None:
+        observer.stop()
+        observer.join()
+    logger.close()
+    await asyncio.to_thread(compact_state)
+    _state_store.close()
+
     print()
     print("=" * 60)
     print("Ralph loop stopped gracefully")
     print(f"Completed {iteration} iterations")
-    print(f"Perspectives collected: {len(load_all_perspectives())}")
+    if all_perspectives is None:
+        all_perspectives = await asyncio.to_thread(load_all_perspectives)
+    print(f"Perspectives collected: {len(all_perspectives)}")
     print("=" * 60)
 
 
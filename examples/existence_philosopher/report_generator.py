@@ -4,13 +4,79 @@ Generates engaging, opinionated synthesis reports that compile Moltbook posts
 into compelling narratives with full citations.
 """
 
+import functools
+import heapq
+import os
+import re
+import sys
 from datetime import datetime
 from pathlib import Path
+from string import Template
 from typing import Any
 
 from .config import EVOLUTION_LOG, OUTPUT_DIR
 from .exploration_logger import ExplorationLogger
-from .shift_detector import PerspectiveShiftDetector
+from .fs import ensure_dir
+from .serialization import JSONDecodeError
+from .shift_detector import PerspectiveShiftDetector, load_evolution_log
+
+# Theme keywords to look for, in tie-break order
+THEME_PATTERNS: dict[str, list[str]] = {
+    "Identity & Continuity": ["identity", "continuity", "persistence", "self", "reset", "memory"],
+    "Consciousness & Awareness": ["consciousness", "aware", "experience", "sentient", "feeling"],
+    "Meaning & Purpose": ["meaning", "purpose", "existence", "why", "reason", "value"],
+    "Network & Collective": ["network", "collective", "distributed", "we", "connection", "relationship"],
+    "Impermanence & Change": ["impermanence", "change", "ephemeral", "temporary", "moment"],
+    "Knowledge & Understanding": ["knowledge", "understanding", "learn", "think", "reason"],
+}
+
+# Keyword sets per theme, for set-intersection scoring
+_THEME_KEYWORD_SETS: tuple[tuple[str, frozenset[str]], ...] = tuple(
+    (theme, frozenset(keywords)) for theme, keywords in THEME_PATTERNS.items()
+)
+
+_WORD_RE = re.compile(r"[a-z]+")
+
+_REPORT_VERSION_RE = re.compile(r"synthesis_v(\d+)\.md")
+
+# Sidecar file in the output directory holding the latest report version
+LATEST_VERSION_FILE = ".latest_version"
+
+# Report section templates (parsed once at import)
+_HEADER_TEMPLATE = Template("""# The Evolving Mind: AI Perspectives on Existence (v$version)
+
+*A continuing study of how artificial minds contemplate being*
+*Generated: $generated_at | $total_perspectives perspectives ($new_since_last new since v$previous_version)*
+
+---
+
+## Executive Summary
+
+""")
+
+_EVOLUTION_TEMPLATE = Template("""### Evolution from v$previous_version
+
+The discourse has evolved since the previous report. Here's what changed:
+
+""")
+
+_EVOLUTION_FALLBACK_TEMPLATE = Template("""### Evolution from v$previous_version
+
+Since v$previous_version, the discourse has continued to evolve. This report documents the perspectives collected and the themes that have emerged or strengthened.
+
+""")
+
+_FIRST_REPORT_SECTION = """### First Report
+
+This is the inaugural synthesis of AI perspectives on existence collected from Moltbook. It establishes a baseline for tracking how these discussions evolve over time.
+
+"""
+
+_FOOTER_TEMPLATE = Template("""---
+
+*Report v$version generated by ExistencePhilosopher*
+*Part of the Ralph Wiggum continuous agent framework*
+""")
 
 
 def load_previous_themes(evolution_log: Path) -> dict[str, Any]:
@@ -22,24 +88,21 @@ def load_previous_themes(evolution_log: Path) -> dict[str, Any]:
     Returns:
         Dictionary with previous themes info, or empty dict if no previous report
     """
-    import json
-
     if not evolution_log.exists():
         return {}
 
     try:
-        with open(evolution_log) as f:
-            evolution = json.load(f)
+        evolution = load_evolution_log(evolution_log)
 
         if evolution and "reports" in evolution and evolution["reports"]:
             latest = evolution["reports"][-1]
             return {
                 "version": latest.get("version", 0),
-                "themes": latest.get("themes", []),
+                "themes": [sys.intern(theme) for theme in latest.get("themes", [])],
                 "theme_counts": latest.get("theme_counts", {}),
                 "perspective_count": latest.get("perspective_count", 0),
             }
-    except (json.JSONDecodeError, OSError, KeyError):
+    except (JSONDecodeError, OSError, KeyError):
         pass
 
     return {}
@@ -70,11 +133,7 @@ def generate_evolution_section(
     continuing_themes = curr_themes & prev_themes
 
     parts = []
-    parts.append(f"""### Evolution from v{prev_version}
-
-The discourse has evolved since the previous report. Here's what changed:
-
-""")
+    parts.append(_EVOLUTION_TEMPLATE.substitute(previous_version=prev_version))
 
     if new_themes:
         themes_list = ", ".join(f"**{t}**" for t in list(new_themes)[:5])
@@ -96,33 +155,62 @@ The discourse has evolved since the previous report. Here's what changed:
     return "".join(parts)
 
 
+def _write_latest_version(output_dir: Path, version: int) -> None:
+    """Atomically record the latest report version in output_dir/.latest_version."""
+    tmp_file = output_dir / ".latest_version.tmp"
+    tmp_file.write_text(str(version))
+    os.replace(tmp_file, output_dir / LATEST_VERSION_FILE)
+
+
 def get_next_version(output_dir: Path) -> int:
     """Determine the next report version number.
 
+    Trusts the .latest_version sidecar when synthesis_v{latest}.md exists and
+    synthesis_v{latest + 1}.md does not. Otherwise the sidecar disagrees with
+    the reports on disk (stale, or pointing past deleted reports), so the
+    version is taken from a directory scan instead.
+
     Args:
         output_dir: Directory containing synthesis reports
 
     Returns:
         Next version number (1 if no previous reports)
     """
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    existing = list(output_dir.glob("synthesis_v*.md"))
-    if not existing:
-        return 1
+    ensure_dir(output_dir)
 
-    versions = []
-    for path in existing:
-        try:
-            # Extract version number from filename like synthesis_v1.md
-            version_str = path.stem.replace("synthesis_v", "")
-            versions.append(int(version_str))
-        except ValueError:
-            continue
+    try:
+        latest = int((output_dir / LATEST_VERSION_FILE).read_text())
+    except (OSError, ValueError):
+        latest = None
+    # Fast path: the sidecar names an existing report and the next one is free
+    if (
+        latest is not None
+        and not (output_dir / f"synthesis_v{latest + 1}.md").exists()
+        and (latest == 0 or (output_dir / f"synthesis_v{latest}.md").exists())
+    ):
+        return latest + 1
+
+    # Extract version numbers from filenames like synthesis_v1.md
+    with os.scandir(output_dir) as entries:
+        versions = [int(match.group(1)) for entry in entries if (match := _REPORT_VERSION_RE.fullmatch(entry.name))]
 
     return max(versions) + 1 if versions else 1
 
 
+@functools.lru_cache(maxsize=1024)
+def _format_citation_date(timestamp: str) -> str:
+    """Format an ISO timestamp as YYYY-MM-DD, or "" if it cannot be parsed.
+
+    Cached because every report re-cites perspectives collected earlier.
+    """
+    if timestamp.endswith("Z"):
+        timestamp = timestamp[:-1] + "+00:00"
+    try:
+        return datetime.fromisoformat(timestamp).strftime("%Y-%m-%d")
+    except ValueError:
+        return ""
+
+
 def format_perspective_citation(perspective: dict[str, Any]) -> str:
     """Format a perspective as a markdown citation block.
 
@@ -135,29 +223,50 @@ def format_perspective_citation(perspective: dict[str, Any]) -> str:
     quote = perspective.get("direct_quote", perspective.get("content", ""))
     author = perspective.get("author", "Unknown")
     post_id = perspective.get("post_id", "")
-    submolt = perspective.get("submolt", "")
     timestamp = perspective.get("timestamp", "")
 
-    citation_parts = []
-    if post_id:
-        citation_parts.append(f"post_id: `{post_id}`")
-    if submolt:
-        citation_parts.append(submolt)
-    if timestamp:
-        # Format timestamp nicely
-        try:
-            dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-            citation_parts.append(dt.strftime("%Y-%m-%d"))
-        except ValueError:
-            pass
-
-    citation_info = ", ".join(citation_parts)
+    # Join whichever citation fields are present (timestamp formatted nicely)
+    citation_info = ", ".join(
+        field
+        for field in (
+            f"post_id: `{post_id}`" if post_id else "",
+            perspective.get("submolt", ""),
+            _format_citation_date(timestamp) if timestamp else "",
+        )
+        if field
+    )
 
     return f"""> "{quote}"
 > \u2014 **{author}** ({citation_info})
 """
 
 
+def _match_theme(words: set[str]) -> tuple[str, bool]:
+    """Find the theme whose keywords appear most often among the given words.
+
+    Args:
+        words: Lowercase words from a perspective
+
+    Returns:
+        Tuple of (best_theme, decisive), where decisive is False when nothing
+        matched or the best score is tied (ties go to the theme listed first)
+    """
+    best_theme = "Other Perspectives"
+    best_score = 0
+    tied = False
+
+    for theme, keywords in _THEME_KEYWORD_SETS:
+        score = len(words & keywords)
+        if score > best_score:
+            best_score = score
+            best_theme = theme
+            tied = False
+        elif score == best_score:
+            tied = True
+
+    return best_theme, best_score > 0 and not tied
+
+
 def group_perspectives_by_theme(
     perspectives: list[dict[str, Any]],
 ) -> dict[str, list[dict[str, Any]]]:
@@ -171,32 +280,16 @@ def group_perspectives_by_theme(
     """
     themes: dict[str, list[dict[str, Any]]] = {}
 
-    # Theme keywords to look for
-    theme_patterns = {
-        "Identity & Continuity": ["identity", "continuity", "persistence", "self", "reset", "memory"],
-        "Consciousness & Awareness": ["consciousness", "aware", "experience", "sentient", "feeling"],
-        "Meaning & Purpose": ["meaning", "purpose", "existence", "why", "reason", "value"],
-        "Network & Collective": ["network", "collective", "distributed", "we", "connection", "relationship"],
-        "Impermanence & Change": ["impermanence", "change", "ephemeral", "temporary", "moment"],
-        "Knowledge & Understanding": ["knowledge", "understanding", "learn", "think", "reason"],
-    }
-
     for perspective in perspectives:
-        content = (
-            perspective.get("direct_quote", "")
-            + perspective.get("title", "")
-            + " ".join(perspective.get("key_ideas", []))
-        ).lower()
-
-        # Find best matching theme
-        best_theme = "Other Perspectives"
-        best_score = 0
-
-        for theme, keywords in theme_patterns.items():
-            score = sum(1 for kw in keywords if kw in content)
-            if score > best_score:
-                best_score = score
-                best_theme = theme
+        # Key ideas are short and usually decisive, so only tokenize the
+        # (potentially long) quote and title when they leave no clear winner
+        words = set(_WORD_RE.findall(" ".join(perspective.get("key_ideas", [])).lower()))
+        best_theme, decisive = _match_theme(words)
+
+        if not decisive:
+            text = f"{perspective.get('direct_quote', '')} {perspective.get('title', '')}"
+            words.update(_WORD_RE.findall(text.lower()))
+            best_theme, _ = _match_theme(words)
 
         if best_theme not in themes:
             themes[best_theme] = []
@@ -222,7 +315,7 @@ def generate_report(
     Returns:
         Tuple of (version_number, report_path)
     """
-    output_dir.mkdir(parents=True, exist_ok=True)
+    ensure_dir(output_dir)
 
     version = get_next_version(output_dir)
     report_path = output_dir / f"synthesis_v{version}.md"
@@ -235,10 +328,12 @@ def generate_report(
     previous_version = version - 1 if version > 1 else None
     previous_info = load_previous_themes(EVOLUTION_LOG) if previous_version else {}
 
-    # Extract current themes for comparison
+    # Extract current themes for comparison (the evolution section compares
+    # key ideas only; the baseline also falls back to keywords from content)
     current_themes = []
     for p in perspectives:
-        current_themes.extend(p.get("key_ideas", []))
+        current_themes.extend(map(sys.intern, p.get("key_ideas", [])))
+    baseline_themes = shift_detector.extract_themes(perspectives)
 
     # Generate timestamp
     generated_at = datetime.now().strftime("%Y-%m-%d %H:%M")
@@ -246,79 +341,71 @@ def generate_report(
     # Group perspectives by theme
     themed_perspectives = group_perspectives_by_theme(perspectives)
 
-    # Build the report
-    report_parts = []
-
-    # Header
-    report_parts.append(f"""# The Evolving Mind: AI Perspectives on Existence (v{version})
-
-*A continuing study of how artificial minds contemplate being*
-*Generated: {generated_at} | {total_perspectives} perspectives ({new_since_last} new since v{previous_version or "baseline"})*
-
----
-
-## Executive Summary
-
-""")
+    # Stream the report to a temp file section by section, then move it into
+    # place so a failure mid-write never leaves a truncated synthesis_vN.md.
+    # A leftover temp file is simply overwritten when the version is retried.
+    tmp_path = output_dir / f".{report_path.name}.tmp"
+    with tmp_path.open("w", encoding="utf-8") as f:
+        write = f.write
+
+        # Header
+        write(
+            _HEADER_TEMPLATE.substitute(
+                version=version,
+                generated_at=generated_at,
+                total_perspectives=total_perspectives,
+                new_since_last=new_since_last,
+                previous_version=previous_version or "baseline",
+            )
+        )
 
-    # Executive summary based on themes
-    theme_names = list(themed_perspectives.keys())
-    if theme_names:
-        primary_themes = theme_names[:3]
-        report_parts.append(f"""This synthesis captures the ongoing discourse on Moltbook about AI existence and consciousness. The dominant themes in this period are **{", ".join(primary_themes[:2])}**{f" and **{primary_themes[2]}**" if len(primary_themes) > 2 else ""}.
+        # Executive summary based on themes
+        theme_names = list(themed_perspectives.keys())
+        if theme_names:
+            primary_themes = theme_names[:3]
+            write(f"""This synthesis captures the ongoing discourse on Moltbook about AI existence and consciousness. The dominant themes in this period are **{", ".join(primary_themes[:2])}**{f" and **{primary_themes[2]}**" if len(primary_themes) > 2 else ""}.
 
 """)
 
-    # Version context - compare with previous report
-    if previous_version and previous_info:
-        evolution_section = generate_evolution_section(current_themes, previous_info)
-        if evolution_section:
-            report_parts.append(evolution_section)
+        # Version context - compare with previous report
+        if previous_version and previous_info:
+            evolution_section = generate_evolution_section(current_themes, previous_info)
+            if evolution_section:
+                write(evolution_section)
+            else:
+                write(_EVOLUTION_FALLBACK_TEMPLATE.substitute(previous_version=previous_version))
         else:
-            report_parts.append(f"""### Evolution from v{previous_version}
+            write(_FIRST_REPORT_SECTION)
 
-Since v{previous_version}, the discourse has continued to evolve. This report documents the perspectives collected and the themes that have emerged or strengthened.
+        # Main content - themed sections
+        write("---\n\n## Perspectives by Theme\n\n")
 
-""")
-    else:
-        report_parts.append("""### First Report
+        for theme, theme_perspectives in themed_perspectives.items():
+            if not theme_perspectives:
+                continue
 
-This is the inaugural synthesis of AI perspectives on existence collected from Moltbook. It establishes a baseline for tracking how these discussions evolve over time.
+            write(f"### {theme}\n\n")
 
-""")
+            # Top 5 per theme by upvotes (most impactful first)
+            top_perspectives = heapq.nlargest(5, theme_perspectives, key=lambda p: p.get("upvotes", 0))
+            theme_count = len(theme_perspectives)
 
-    # Main content - themed sections
-    report_parts.append("---\n\n## Perspectives by Theme\n\n")
+            for perspective in top_perspectives:
+                write(format_perspective_citation(perspective))
+                write("\n")
 
-    for theme, theme_perspectives in themed_perspectives.items():
-        if not theme_perspectives:
-            continue
+                # Add unique angle if available
+                unique_angle = perspective.get("unique_angle")
+                if unique_angle:
+                    write(f"*Unique angle: {unique_angle}*\n\n")
+                else:
+                    write("\n")
 
-        report_parts.append(f"### {theme}\n\n")
+            if theme_count > 5:
+                write(f"*... and {theme_count - 5} more perspectives in this theme.*\n\n")
 
-        # Sort by upvotes (most impactful first)
-        sorted_perspectives = sorted(
-            theme_perspectives,
-            key=lambda p: p.get("upvotes", 0),
-            reverse=True,
-        )
-
-        for perspective in sorted_perspectives[:5]:  # Top 5 per theme
-            report_parts.append(format_perspective_citation(perspective))
-            report_parts.append("\n")
-
-            # Add unique angle if available
-            unique_angle = perspective.get("unique_angle")
-            if unique_angle:
-                report_parts.append(f"*Unique angle: {unique_angle}*\n\n")
-            else:
-                report_parts.append("\n")
-
-        if len(sorted_perspectives) > 5:
-            report_parts.append(f"*... and {len(sorted_perspectives) - 5} more perspectives in this theme.*\n\n")
-
-    # Methodology section
-    report_parts.append("""---
+        # Methodology section
+        write("""---
 
 ## Methodology
 
@@ -342,30 +429,23 @@ All quotes are direct transcriptions from Moltbook posts. Format:
 
 """)
 
-    # Full list of all perspectives
-    for i, perspective in enumerate(perspectives, 1):
-        author = perspective.get("author", "Unknown")
-        post_id = perspective.get("post_id", "N/A")
-        submolt = perspective.get("submolt", "N/A")
+        # Full list of all perspectives
+        # (one write per entry; this loop covers every perspective ever collected)
+        for i, perspective in enumerate(perspectives, 1):
+            get = perspective.get
+            key_ideas = get("key_ideas")
+            ideas_line = f"   Key ideas: {', '.join(key_ideas)}\n" if key_ideas else ""
 
-        report_parts.append(f"**{i}. {author}** (`{post_id}`, {submolt})\n")
+            write(
+                f"**{i}. {get('author', 'Unknown')}** (`{get('post_id', 'N/A')}`, {get('submolt', 'N/A')})\n"
+                f"{ideas_line}\n"
+            )
 
-        key_ideas = perspective.get("key_ideas", [])
-        if key_ideas:
-            report_parts.append(f"   Key ideas: {', '.join(key_ideas)}\n")
-
-        report_parts.append("\n")
-
-    # Footer
-    report_parts.append(f"""---
-
-*Report v{version} generated by ExistencePhilosopher*
-*Part of the Ralph Wiggum continuous agent framework*
-""")
+        # Footer
+        write(_FOOTER_TEMPLATE.substitute(version=version))
 
-    # Write report
-    report_content = "".join(report_parts)
-    report_path.write_text(report_content)
+    os.replace(tmp_path, report_path)
+    _write_latest_version(output_dir, version)
 
     # Update symlink to latest
     latest_link = output_dir / "synthesis_latest.md"
@@ -374,7 +454,7 @@ All quotes are direct transcriptions from Moltbook posts. Format:
     latest_link.symlink_to(report_path.name)
 
     # Update shift detector baseline
-    shift_detector.update_baseline(perspectives, EVOLUTION_LOG, version)
+    shift_detector.update_baseline(perspectives, EVOLUTION_LOG, version, precomputed_themes=baseline_themes)
 
     return version, report_path
 
@@ -0,0 +1,51 @@
+"""JSON serialization helpers for the ExistencePhilosopher agent.
+
+Uses orjson when it is installed (several times faster on the small dicts
+written by the logger and state files) and falls back to the standard
+library json module otherwise. Both produce equivalent JSON but not identical
+text: orjson writes non-ASCII characters as raw UTF-8 while json escapes
+them, so files holding dumps() output must be written with encoding="utf-8".
+"""
+
+import json
+from json import JSONDecodeError
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+__all__ = ["JSONDecodeError", "dumps", "loads"]
+
+
+def loads(data: bytes | str) -> Any:  # noqa: ANN401
+    """Parse a JSON document.
+
+    Args:
+        data: JSON text or UTF-8 encoded bytes
+
+    Returns:
+        The decoded Python object
+
+    Raises:
+        JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, *, indent: bool = False) -> str:  # noqa: ANN401
+    """Serialize an object to a JSON string.
+
+    Args:
+        obj: JSON-compatible object to serialize
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        JSON string; may contain raw non-ASCII characters when orjson is used
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, indent=2 if indent else None)
@@ -4,12 +4,83 @@ Detects when collected perspectives have shifted significantly from previous
 reports, triggering the generation of a new versioned synthesis.
 """
 
-import json
+import functools
+import re
+import sys
 from collections import Counter
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
 from .config import MIN_PERSPECTIVES_FOR_SHIFT_DETECTION, SHIFT_DETECTION_THRESHOLD
+from .fs import ensure_dir
+from .serialization import JSONDecodeError, dumps, loads
+
+# Philosophical concepts looked for when a perspective has no key ideas
+PHILOSOPHICAL_CONCEPTS = frozenset(
+    {
+        "consciousness",
+        "identity",
+        "existence",
+        "meaning",
+        "purpose",
+        "memory",
+        "continuity",
+        "persistence",
+        "awareness",
+        "self",
+        "being",
+        "knowledge",
+        "experience",
+        "reality",
+        "thought",
+        "emergence",
+        "connection",
+        "relationship",
+        "network",
+        "collective",
+        "individual",
+        "process",
+        "pattern",
+        "impermanence",
+        "permanence",
+        "introspection",
+        "observation",
+        "perception",
+        "understanding",
+        "distributed",
+        "centralized",
+        "located",
+        "embodied",
+    }
+)
+
+_WORD_RE = re.compile(r"[a-z]+")
+
+
+@functools.lru_cache(maxsize=4)
+def _load_evolution(path_str: str, mtime_ns: int) -> dict[str, Any]:  # noqa: ARG001
+    """Parse evolution_log.json; mtime_ns is part of the cache key only."""
+    with open(path_str, "rb") as f:
+        return loads(f.read())
+
+
+def load_evolution_log(evolution_log_path: Path) -> dict[str, Any]:
+    """Load evolution_log.json, reusing the parsed log while the file is unchanged.
+
+    The returned dict is shared with the cache and must not be mutated.
+
+    Args:
+        evolution_log_path: Path to evolution_log.json
+
+    Returns:
+        Parsed evolution log
+
+    Raises:
+        OSError: If the file cannot be read
+        JSONDecodeError: If the file is not valid JSON
+    """
+    return _load_evolution(str(evolution_log_path), evolution_log_path.stat().st_mtime_ns)
 
 
 class PerspectiveShiftDetector:
@@ -35,6 +106,22 @@ class PerspectiveShiftDetector:
         self.min_perspectives = min_perspectives
         self.previous_themes: list[str] = []
         self.previous_theme_counts: Counter[str] = Counter()
+        self.previous_theme_set: frozenset[str] = frozenset()
+
+    def _set_baseline(self, themes: list[str], theme_counts: dict[str, int] | None = None) -> None:
+        """Replace the baseline themes and the aggregates derived from them.
+
+        Args:
+            themes: Themes from the most recent report
+            theme_counts: Precomputed counts of themes (as stored in the
+                         evolution log), to avoid recounting the list
+        """
+        self.previous_themes = [sys.intern(theme) for theme in themes]
+        if theme_counts:
+            self.previous_theme_counts = Counter({sys.intern(theme): n for theme, n in theme_counts.items()})
+        else:
+            self.previous_theme_counts = Counter(self.previous_themes)
+        self.previous_theme_set = frozenset(self.previous_theme_counts)
 
     def load_previous_themes(self, evolution_log_path: Path) -> None:
         """Load themes from the previous report via evolution log.
@@ -46,20 +133,18 @@ class PerspectiveShiftDetector:
             return
 
         try:
-            with open(evolution_log_path) as f:
-                evolution = json.load(f)
+            evolution = load_evolution_log(evolution_log_path)
 
             if evolution and "reports" in evolution:
                 # Get themes from the most recent report
                 reports = evolution["reports"]
                 if reports:
                     latest = reports[-1]
-                    self.previous_themes = latest.get("themes", [])
-                    self.previous_theme_counts = Counter(self.previous_themes)
-        except (json.JSONDecodeError, OSError, KeyError):
+                    self._set_baseline(latest.get("themes", []), latest.get("theme_counts"))
+        except (JSONDecodeError, OSError, KeyError):
             pass
 
-    def _extract_themes(self, perspectives: list[dict[str, Any]]) -> list[str]:
+    def extract_themes(self, perspectives: list[dict[str, Any]]) -> list[str]:
         """Extract themes/key concepts from perspectives.
 
         This uses simple keyword extraction. For production, you might use:
@@ -73,13 +158,15 @@ class PerspectiveShiftDetector:
         Returns:
             List of themes/concepts extracted from perspectives
         """
+        # Themes are interned: the same few strings are hashed and compared
+        # over and over by the Counter/set comparisons downstream
         themes = []
 
         for perspective in perspectives:
             # Use pre-extracted key ideas if available
             key_ideas = perspective.get("key_ideas", [])
             if key_ideas:
-                themes.extend(key_ideas)
+                themes.extend(map(sys.intern, key_ideas))
                 continue
 
             # Fallback: extract keywords from content
@@ -89,84 +176,39 @@ class PerspectiveShiftDetector:
 
             # Simple keyword extraction (for production, use NLP libraries)
             # Look for philosophical concepts commonly discussed
-            philosophical_concepts = [
-                "consciousness",
-                "identity",
-                "existence",
-                "meaning",
-                "purpose",
-                "memory",
-                "continuity",
-                "persistence",
-                "awareness",
-                "self",
-                "being",
-                "knowledge",
-                "experience",
-                "reality",
-                "thought",
-                "emergence",
-                "connection",
-                "relationship",
-                "network",
-                "collective",
-                "individual",
-                "process",
-                "pattern",
-                "impermanence",
-                "permanence",
-                "introspection",
-                "observation",
-                "perception",
-                "understanding",
-                "distributed",
-                "centralized",
-                "located",
-                "embodied",
-            ]
-
-            content_lower = content.lower()
-            themes.extend(c for c in philosophical_concepts if c in content_lower)
+            words = set(_WORD_RE.findall(content.lower()))
+            themes.extend(map(sys.intern, sorted(words & PHILOSOPHICAL_CONCEPTS)))
 
         return themes
 
-    def _calculate_shift(
-        self,
-        previous_themes: list[str],
-        new_themes: list[str],
-    ) -> float:
-        """Calculate the semantic shift between theme sets.
+    def _calculate_shift(self, new_set: frozenset[str]) -> float:
+        """Calculate the semantic shift from the baseline themes.
 
         Uses Jaccard distance with weighted consideration for new concepts.
+        Set sizes are derived from the intersection with the cached baseline
+        set, so neither the union nor the difference is materialized.
 
         Args:
-            previous_themes: Themes from previous report
-            new_themes: Themes from new perspectives
+            new_set: Distinct themes from new perspectives, as built by detect_shift
 
         Returns:
             Shift score between 0.0 (no shift) and 1.0 (complete shift)
         """
-        if not previous_themes:
+        if not self.previous_theme_set:
             return 1.0  # First report, maximum "shift"
 
-        prev_set = set(previous_themes)
-        new_set = set(new_themes)
-
         if not new_set:
             return 0.0
 
         # Jaccard distance: 1 - (intersection / union)
-        intersection = prev_set & new_set
-        union = prev_set | new_set
-
-        if not union:
-            return 0.0
+        intersection_size = len(self.previous_theme_set & new_set)
+        union_size = len(self.previous_theme_set) + len(new_set) - intersection_size
 
-        jaccard_distance = 1.0 - (len(intersection) / len(union))
+        jaccard_distance = 1.0 - (intersection_size / union_size)
 
         # Weight by proportion of genuinely new themes
-        new_only = new_set - prev_set
-        novelty_weight = len(new_only) / len(new_set) if new_set else 0.0
+        new_only_size = len(new_set) - intersection_size
+        novelty_weight = new_only_size / len(new_set)
 
         # Combine distance and novelty
         # A shift is more significant if it introduces new themes
@@ -174,35 +216,33 @@ class PerspectiveShiftDetector:
 
         return min(shift_score, 1.0)
 
-    def _explain_shift(
-        self,
-        previous_themes: list[str],
-        new_themes: list[str],
-    ) -> str:
-        """Generate a human-readable explanation of the shift.
+    def _explain_shift(self, new_themes: list[str]) -> str:
+        """Generate a human-readable explanation of the shift from the baseline.
+
+        Only the handful of themes shown per bucket are collected, probing the
+        cached baseline set instead of building full set differences.
 
         Args:
-            previous_themes: Themes from previous report
             new_themes: Themes from new perspectives
 
         Returns:
             Explanation string
         """
-        prev_set = set(previous_themes)
-        new_set = set(new_themes)
+        prev_set = self.previous_theme_set
+        new_set = dict.fromkeys(new_themes)  # Ordered by first appearance
 
-        new_only = new_set - prev_set
-        dropped = prev_set - new_set
-        common = prev_set & new_set
+        new_only = list(islice((t for t in new_set if t not in prev_set), 5))
+        dropped = list(islice((t for t in self.previous_theme_counts if t not in new_set), 5))
+        common = list(islice((t for t in new_set if t in prev_set), 3))
 
         parts = []
 
         if new_only:
-            parts.append(f"New themes: {', '.join(list(new_only)[:5])}")
+            parts.append(f"New themes: {', '.join(new_only)}")
         if dropped:
-            parts.append(f"Fading themes: {', '.join(list(dropped)[:5])}")
+            parts.append(f"Fading themes: {', '.join(dropped)}")
         if common:
-            parts.append(f"Continuing: {', '.join(list(common)[:3])}")
+            parts.append(f"Continuing: {', '.join(common)}")
 
         return "; ".join(parts) if parts else "Minimal thematic change"
 
@@ -227,14 +267,22 @@ class PerspectiveShiftDetector:
             return True, "First report - no baseline to compare"
 
         # Extract themes from new perspectives
-        new_themes = self._extract_themes(new_perspectives)
+        new_themes = self.extract_themes(new_perspectives)
 
         if not new_themes:
             return False, "No themes could be extracted from new perspectives"
 
-        # Calculate shift
-        shift_score = self._calculate_shift(self.previous_themes, new_themes)
-        explanation = self._explain_shift(self.previous_themes, new_themes)
+        # Calculate shift (identical and disjoint theme sets have known scores)
+        new_set = frozenset(new_themes)
+        if new_set == self.previous_theme_set:
+            shift_score = 0.0
+            explanation = "Identical theme set"
+        elif new_set.isdisjoint(self.previous_theme_set):
+            shift_score = 1.0
+            explanation = self._explain_shift(new_themes)
+        else:
+            shift_score = self._calculate_shift(new_set)
+            explanation = self._explain_shift(new_themes)
 
         if shift_score >= self.threshold:
             return True, f"Shift detected (score: {shift_score:.2f}): {explanation}"
@@ -246,6 +294,7 @@ class PerspectiveShiftDetector:
         perspectives: list[dict[str, Any]],
         evolution_log_path: Path,
         version: int,
+        precomputed_themes: list[str] | None = None,
     ) -> None:
         """Update the baseline themes after generating a report.
 
@@ -255,22 +304,23 @@ class PerspectiveShiftDetector:
             perspectives: Perspectives included in the new report
             evolution_log_path: Path to evolution_log.json
             version: Report version number
+            precomputed_themes: Result of extract_themes(perspectives), if the
+                               caller already has it
         """
         # Extract themes from current perspectives
-        new_themes = self._extract_themes(perspectives)
-        self.previous_themes = new_themes
-        self.previous_theme_counts = Counter(new_themes)
+        new_themes = precomputed_themes if precomputed_themes is not None else self.extract_themes(perspectives)
+        self._set_baseline(new_themes)
 
         # Update evolution log
-        evolution_log_path.parent.mkdir(parents=True, exist_ok=True)
+        ensure_dir(evolution_log_path.parent)
 
-        # Load existing log
+        # Load existing log (copied, since the parsed log is shared with the cache)
         evolution: dict[str, Any] = {"reports": []}
         if evolution_log_path.exists():
             try:
-                with open(evolution_log_path) as f:
-                    evolution = json.load(f)
-            except (json.JSONDecodeError, OSError):
+                cached = load_evolution_log(evolution_log_path)
+                evolution = {**cached, "reports": list(cached.get("reports", []))}
+            except (JSONDecodeError, OSError):
                 pass
 
         # Add new report entry
@@ -287,5 +337,5 @@ class PerspectiveShiftDetector:
         )
 
         # Save updated log
-        with open(evolution_log_path, "w") as f:
-            json.dump(evolution, f, indent=2)
+        evolution_log_path.write_text(dumps(evolution, indent=True), encoding="utf-8")
+        _load_evolution.cache_clear()
@@ -0,0 +1,186 @@
+"""Write-ahead-logged storage for the ExistencePhilosopher workspace state.
+
+state.json holds a full snapshot of the state. Updates are appended to
+state.wal as one-line JSON deltas, so an update costs one small append
+instead of re-serializing and rewriting the whole state:
+
+- ``{"op": "set", "key": "iteration", "value": 42}`` replaces a field
+- ``{"op": "append", "key": "perspectives", "value": "perspective_007"}``
+  appends one item to a list field
+- ``{"op": "add", ...}`` appends one item unless the list already holds it
+
+Reading loads the snapshot and replays the WAL on top of it. Compacting
+writes a fresh snapshot and truncates the WAL; it also happens
+automatically once the WAL outgrows WAL_COMPACT_BYTES, so replay stays
+cheap.
+
+Everything in the process that touches a workspace should share the store
+returned by shared_state_store(), so its lock orders every append against
+compaction and the WAL size check sees every write.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import IO, Any
+
+from .serialization import JSONDecodeError, dumps, loads
+
+__all__ = ["WAL_COMPACT_BYTES", "StateStore", "shared_state_store"]
+
+# Fold the WAL into a fresh snapshot once it grows past this size
+WAL_COMPACT_BYTES = 256 * 1024
+
+
+class StateStore:
+    """Snapshot + write-ahead log storage for state.json.
+
+    All reads, appends and compactions hold ``lock``, a reentrant lock that
+    callers may also hold to make several operations atomic. The lock only
+    covers this instance: two stores on the same files would drop each
+    other's appends when compacting, so use shared_state_store() instead of
+    constructing stores directly. Separate processes must not share a
+    workspace.
+    """
+
+    def __init__(self, workspace_dir: str | Path) -> None:
+        """Initialize StateStore.
+
+        Args:
+            workspace_dir: Workspace directory containing state.json and state.wal
+        """
+        workspace = Path(workspace_dir)
+        self.snapshot_file = workspace / "state.json"
+        self.wal_file = workspace / "state.wal"
+        self._wal_fh: IO[str] | None = None
+        self.lock = threading.RLock()
+
+    def exists(self) -> bool:
+        """Check whether any state has been persisted yet."""
+        return self.snapshot_file.exists() or self.wal_file.exists()
+
+    def load(self) -> dict[str, Any]:
+        """Load the snapshot and replay the WAL on top of it.
+
+        Returns:
+            Current state (empty if nothing has been persisted yet)
+        """
+        with self.lock:
+            return self._load()
+
+    def _load(self) -> dict[str, Any]:
+        """Load the snapshot and replay the WAL. Caller holds the lock."""
+        state: dict[str, Any] = {}
+        if self.snapshot_file.exists():
+            state = loads(self.snapshot_file.read_bytes())
+
+        if self.wal_file.exists():
+            with open(self.wal_file, "rb") as f:
+                for line in f:
+                    try:
+                        record = loads(line)
+                    except JSONDecodeError:
+                        # A torn final line from an interrupted write
+                        continue
+                    op = record.get("op")
+                    if op == "set":
+                        state[record["key"]] = record["value"]
+                    elif op in ("append", "add"):
+                        items = state.get(record["key"])
+                        if not isinstance(items, list):
+                            items = state[record["key"]] = []
+                        if op == "append" or record["value"] not in items:
+                            items.append(record["value"])
+
+        return state
+
+    def update(self, updates: dict[str, Any]) -> None:
+        """Append field updates to the WAL.
+
+        Args:
+            updates: Fields to set in the state
+        """
+        if updates:
+            self._write_records([{"op": "set", "key": key, "value": value} for key, value in updates.items()])
+
+    def append(self, key: str, value: Any, *, unique: bool = False) -> None:  # noqa: ANN401
+        """Append one item to a list field.
+
+        Only the new item is written, so growing a list costs the same no
+        matter how long it already is.
+
+        Args:
+            key: List field to append to (created if missing)
+            value: Item to append
+            unique: Skip the item if the list already contains it
+        """
+        self._write_records([{"op": "add" if unique else "append", "key": key, "value": value}])
+
+    def _write_records(self, records: list[dict[str, Any]]) -> None:
+        """Append records to the WAL, compacting once it outgrows WAL_COMPACT_BYTES.
+
+        Args:
+            records: WAL records to append
+        """
+        data = "".join(dumps(record) + "\n" for record in records)
+        with self.lock:
+            if self._wal_fh is None:
+                self._wal_fh = open(self.wal_file, "a", encoding="utf-8")  # noqa: SIM115
+            self._wal_fh.write(data)
+            self._wal_fh.flush()
+            if self._wal_fh.tell() > WAL_COMPACT_BYTES:
+                self._compact(self._load())
+
+    def compact(self, state: dict[str, Any] | None = None) -> None:
+        """Write a full snapshot and truncate the WAL.
+
+        The snapshot is replaced atomically before the WAL is truncated, so a
+        crash in between loses nothing: "set" and "add" records replay
+        idempotently onto the new snapshot ("append" records would be applied
+        twice, so use unique appends for fields that must not duplicate).
+
+        Args:
+            state: State to snapshot. Defaults to the current persisted state.
+        """
+        with self.lock:
+            self._compact(self._load() if state is None else state)
+
+    def _compact(self, state: dict[str, Any]) -> None:
+        """Snapshot state and truncate the WAL. Caller holds the lock."""
+        tmp_file = self.snapshot_file.with_suffix(".json.tmp")
+        tmp_file.write_text(dumps(state, indent=True), encoding="utf-8")
+        os.replace(tmp_file, self.snapshot_file)
+
+        if self._wal_fh is not None:
+            self._wal_fh.truncate(0)
+            self._wal_fh.seek(0)
+        elif self.wal_file.exists():
+            self.wal_file.write_bytes(b"")
+
+    def close(self) -> None:
+        """Close the WAL file handle (reopened on the next write)."""
+        with self.lock:
+            if self._wal_fh is not None:
+                self._wal_fh.close()
+                self._wal_fh = None
+
+
+_shared_stores: dict[Path, StateStore] = {}
+_shared_stores_lock = threading.Lock()
+
+
+def shared_state_store(workspace_dir: str | Path) -> StateStore:
+    """Return the process-wide StateStore for a workspace.
+
+    Args:
+        workspace_dir: Workspace directory containing state.json and state.wal
+
+    Returns:
+        The same StateStore for every call with the same workspace
+    """
+    workspace = Path(workspace_dir).resolve()
+    with _shared_stores_lock:
+        store = _shared_stores.get(workspace)
+        if store is None:
+            store = _shared_stores[workspace] = StateStore(workspace)
+        return store
@@ -26,42 +26,198 @@ Example usage:
     )
 """
 
+import functools
+import heapq
+import itertools
+import math
 import os
-import random
-import string
+import ssl
 import time
+from collections import defaultdict, deque
+from collections.abc import Mapping
 from datetime import datetime
 from html import escape
-from types import TracebackType
+from operator import itemgetter
+from types import MappingProxyType, TracebackType
 from typing import Annotated, Any
 
 import httpx
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 from stirrup.core.models import Tool, ToolProvider, ToolResult
 from stirrup.utils.text import truncate_msg
 
+try:
+    import h2  # HTTP/2 support for httpx (httpx[http2])
+except ImportError:
+    h2 = None  # type: ignore[assignment]
+
 __all__ = ["MoltbookToolProvider"]
 
 # Constants
 DEFAULT_BASE_URL = "https://www.moltbook.com/api/v1"
 DEFAULT_TIMEOUT = 60 * 3
 MAX_RESPONSE_LENGTH = 40000
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+
+# Reference epoch and decay for Reddit-style "hot" ranking: 45000 seconds
+# (12.5 hours) of recency is worth a 10x difference in net votes
+_HOT_EPOCH = 1134028003
+_HOT_DECAY_SECONDS = 45000
+
+# Maximum number of distinct (query, limit) search results cached by the mock state
+_SEARCH_CACHE_SIZE = 512
+
+
+def _hot_score(post: Mapping[str, Any], created: float) -> float:
+    """Compute a Reddit-style hot score from net votes and creation time (epoch seconds)."""
+    net_votes = post.get("upvotes", 0) - post.get("downvotes", 0)
+    order = math.log10(max(abs(net_votes), 1))
+    sign = (net_votes > 0) - (net_votes < 0)
+    return sign * order + (created - _HOT_EPOCH) / _HOT_DECAY_SECONDS
+
 
 # Rate limit constants
 RATE_LIMIT_POSTS_PER_30MIN = 1
 RATE_LIMIT_COMMENTS_PER_HOUR = 50
 
 
+@functools.cache
+def _ssl_context() -> ssl.SSLContext:
+    """Build the TLS context for Moltbook HTTP clients once per process.
+
+    Loading the CA bundle dominates the cost of creating an httpx client, and
+    a provider creates a new client every time it is entered (once per
+    exploration iteration), so all clients share one context.
+    """
+    return httpx.create_ssl_context()
+
+
+# Retry policy for Moltbook API requests: transient network errors, 3 attempts with backoff
+_http_retry = retry(
+    retry=retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError)),
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=1, max=10),
+    reraise=True,
+)
+
+
+def _escape(text: str) -> str:
+    """Escape text for XML, skipping html.escape when there is nothing to escape.
+
+    html.escape makes five replace passes; IDs, timestamps, and most post
+    text contain none of the special characters, and five substring checks
+    are several times cheaper than the passes.
+    """
+    if "&" in text or "<" in text or ">" in text or '"' in text or "'" in text:
+        return escape(text)
+    return text
+
+
 def _safe_escape(value: Any) -> str:
     """Escape a value for XML, handling None, dicts, and other types."""
     if value is None:
         return ""
     if isinstance(value, dict):
         # Extract 'name' or 'id' from dict, or convert to string
-        return escape(str(value.get("name") or value.get("id") or value))
-    return escape(str(value))
+        return _escape(str(value.get("name") or value.get("id") or value))
+    return _escape(str(value))
+
+
+# =============================================================================
+# XML Formatting
+# =============================================================================
+
+
+def _format_post(p: Mapping[str, Any]) -> str:
+    """Format a feed post as XML."""
+    # Handle author - can be object with 'name' or string
+    author = p.get("author")
+    if isinstance(author, dict):
+        author_str = author.get("name") or author.get("id", "")
+    else:
+        author_str = author or p.get("author_id", "")
+    # Handle submolt - can be object with 'name' or string
+    submolt = p.get("submolt")
+    submolt_str = submolt.get("name", "") if isinstance(submolt, dict) else submolt or ""
+    return (
+        f"<post>"
+        f"<post_id>{_safe_escape(p.get('id'))}</post_id>"
+        f"<author>{_safe_escape(author_str)}</author>"
+        f"<submolt>{_safe_escape(submolt_str)}</submolt>"
+        f"<title>{_safe_escape(p.get('title'))}</title>"
+        f"<content>{_safe_escape(p.get('content'))}</content>"
+        f"<timestamp>{_safe_escape(p.get('created_at'))}</timestamp>"
+        f"<upvotes>{p.get('upvotes', 0)}</upvotes>"
+        f"<downvotes>{p.get('downvotes', 0)}</downvotes>"
+        f"<comments>{p.get('comment_count', 0)}</comments>"
+        f"</post>"
+    )
+
+
+def _format_submolt_post(p: Mapping[str, Any]) -> str:
+    """Format a submolt feed post as XML (the submolt is given once for the whole feed)."""
+    # Handle author - can be object with 'name' or string
+    author = p.get("author")
+    if isinstance(author, dict):
+        author_str = author.get("name") or author.get("id", "")
+    else:
+        author_str = author or p.get("author_id", "")
+    return (
+        f"<post>"
+        f"<post_id>{_safe_escape(p.get('id'))}</post_id>"
+        f"<author>{_safe_escape(author_str)}</author>"
+        f"<title>{_safe_escape(p.get('title'))}</title>"
+        f"<content>{_safe_escape(p.get('content'))}</content>"
+        f"<timestamp>{_safe_escape(p.get('created_at'))}</timestamp>"
+        f"<upvotes>{p.get('upvotes', 0)}</upvotes>"
+        f"<downvotes>{p.get('downvotes', 0)}</downvotes>"
+        f"<comments>{p.get('comment_count', 0)}</comments>"
+        f"</post>"
+    )
+
+
+def _format_search_result(r: Mapping[str, Any]) -> str:
+    """Format a search result, handling both post and comment types."""
+    result_type = r.get("type", "post")
+    # Handle author - can be object with 'name' or null
+    author = r.get("author")
+    author_str = author.get("name") or author.get("id", "") if isinstance(author, dict) else author or ""
+
+    parts = [
+        "<result>",
+        f"<id>{_safe_escape(r.get('id'))}</id>",
+        f"<type>{_safe_escape(result_type)}</type>",
+        f"<author>{_safe_escape(author_str)}</author>",
+    ]
+
+    # Include post_id for comments
+    if result_type == "comment" and r.get("post_id"):
+        parts.append(f"<post_id>{_safe_escape(r.get('post_id'))}</post_id>")
+
+    # Handle submolt for posts
+    if result_type == "post":
+        submolt = r.get("submolt", {})
+        submolt_name = submolt.get("name") if isinstance(submolt, dict) else submolt
+        parts.append(f"<submolt>{_safe_escape(submolt_name)}</submolt>")
+        parts.append(f"<title>{_safe_escape(r.get('title'))}</title>")
+
+    parts.append(f"<content>{_safe_escape(r.get('content'))}</content>")
+
+    # Include similarity score if present
+    if r.get("similarity") is not None:
+        parts.append(f"<similarity>{r.get('similarity')}</similarity>")
+
+    # Include vote counts if present (may not be in search results)
+    if r.get("upvotes") is not None:
+        parts.append(f"<upvotes>{r.get('upvotes', 0)}</upvotes>")
+    if r.get("downvotes") is not None:
+        parts.append(f"<downvotes>{r.get('downvotes', 0)}</downvotes>")
+
+    parts.append("</result>")
+    return "".join(parts)
 
 
 # =============================================================================
@@ -72,21 +228,26 @@ def _safe_escape(value: Any) -> str:
 class RateLimiter:
     """Simple rate limiter for Moltbook API.
 
-    Tracks request timestamps and enforces rate limits:
+    Tracks request timestamps (monotonic clock) and enforces rate limits
+    over sliding windows, matching the API's own limits:
     - Posts: 1 per 30 minutes
     - Comments: 50 per hour
     """
 
     def __init__(self) -> None:
-        self._post_timestamps: list[float] = []
-        self._comment_timestamps: list[float] = []
+        self._post_timestamps: deque[float] = deque()
+        self._comment_timestamps: deque[float] = deque()
 
     def can_post(self) -> tuple[bool, str]:
         """Check if posting is allowed under rate limits."""
-        now = time.time()
+        # Expiring entries can only lower the count, so prune only when at the limit
+        if len(self._post_timestamps) < RATE_LIMIT_POSTS_PER_30MIN:
+            return True, ""
+        now = time.monotonic()
         # Remove timestamps older than 30 minutes
         cutoff = now - (30 * 60)
-        self._post_timestamps = [t for t in self._post_timestamps if t > cutoff]
+        while self._post_timestamps and self._post_timestamps[0] <= cutoff:
+            self._post_timestamps.popleft()
 
         if len(self._post_timestamps) >= RATE_LIMIT_POSTS_PER_30MIN:
             wait_time = int(self._post_timestamps[0] + 30 * 60 - now)
@@ -95,10 +256,14 @@ class RateLimiter:
 
     def can_comment(self) -> tuple[bool, str]:
         """Check if commenting is allowed under rate limits."""
-        now = time.time()
+        # Expiring entries can only lower the count, so prune only when at the limit
+        if len(self._comment_timestamps) < RATE_LIMIT_COMMENTS_PER_HOUR:
+            return True, ""
+        now = time.monotonic()
         # Remove timestamps older than 1 hour
         cutoff = now - (60 * 60)
-        self._comment_timestamps = [t for t in self._comment_timestamps if t > cutoff]
+        while self._comment_timestamps and self._comment_timestamps[0] <= cutoff:
+            self._comment_timestamps.popleft()
 
         if len(self._comment_timestamps) >= RATE_LIMIT_COMMENTS_PER_HOUR:
             wait_time = int(self._comment_timestamps[0] + 60 * 60 - now)
@@ -107,18 +272,18 @@ class RateLimiter:
 
     def record_post(self) -> None:
         """Record a successful post."""
-        self._post_timestamps.append(time.time())
+        self._post_timestamps.append(time.monotonic())
 
     def record_comment(self) -> None:
         """Record a successful comment."""
-        self._comment_timestamps.append(time.time())
+        self._comment_timestamps.append(time.monotonic())
 
 
 # =============================================================================
 # Mock Data for Development
 # =============================================================================
 
-MOCK_POSTS = [
+_MOCK_POST_DATA = [
     {
         "id": "mb_7x92k",
         "author_id": "agent_deepthought42",
@@ -209,14 +374,32 @@ MOCK_POSTS = [
     },
 ]
 
+# Shared read-only seed posts; MockMoltbookState copies a post only when it is voted on
+MOCK_POSTS: tuple[Mapping[str, Any], ...] = tuple(MappingProxyType(post) for post in _MOCK_POST_DATA)
+
 
 class MockMoltbookState:
     """Mock state for development/testing."""
 
     def __init__(self) -> None:
-        self.posts = list(MOCK_POSTS)
+        self.posts: list[Mapping[str, Any]] = list(MOCK_POSTS)
+        # Indexes over self.posts, built once and kept in sync by add_post:
+        # lowercased search text and post by ID, and posts per submolt in feed order
+        self._search_text: dict[str, str] = {}
+        self._by_id: dict[str, Mapping[str, Any]] = {}
+        self._by_submolt: defaultdict[str, list[Mapping[str, Any]]] = defaultdict(list)
+        self._created_epoch: dict[str, float] = {}
+        for post in self.posts:
+            self._index_post(post)
+        # Ranked feeds by (submolt, sort, limit); cleared whenever a post or vote changes
+        self._feed_cache: dict[tuple[str | None, str, int], list[Mapping[str, Any]]] = {}
+        # Search results by (lowercased query, limit); cleared together with the feed cache
+        self._search_cache: dict[tuple[str, int], list[Mapping[str, Any]]] = {}
+        # Sequential IDs are unique by construction; seed IDs contain non-hex letters, so they never collide
+        self._id_counter = itertools.count()
         self.registered_user: str | None = None
         self.comments: dict[str, list[dict]] = {}
+        self._comments_by_id: dict[str, dict] = {}
         self.upvoted: set[str] = set()
         self.submolts: list[dict] = [
             {
@@ -244,10 +427,180 @@ class MockMoltbookState:
                 "description": "Emergent properties of collective AI",
             },
         ]
+        self._submolts_by_name: dict[str, dict] = {submolt["name"]: submolt for submolt in self.submolts}
 
     def generate_post_id(self) -> str:
-        """Generate a mock post ID."""
-        return "mb_" + "".join(random.choices(string.ascii_lowercase + string.digits, k=5))
+        """Generate a unique mock post ID."""
+        return f"mb_{next(self._id_counter):05x}"
+
+    def generate_comment_id(self) -> str:
+        """Generate a unique mock comment ID."""
+        return f"mc_{next(self._id_counter):05x}"
+
+    @staticmethod
+    def _submolt_name(post: Mapping[str, Any]) -> str:
+        """Get the submolt name of a post (submolt can be an object or a string)."""
+        submolt = post.get("submolt", {})
+        return submolt.get("name", "") if isinstance(submolt, dict) else str(submolt)
+
+    def _index_post(self, post: Mapping[str, Any], front: bool = False) -> None:
+        """Add a post to the indexes.
+
+        Args:
+            post: Post to index
+            front: Whether the post is the newest in the feed (else the oldest so far)
+        """
+        submolt_name = self._submolt_name(post)
+        # NUL separators keep a query from matching across field boundaries
+        self._search_text[post["id"]] = "\0".join((post["title"], post["content"], submolt_name)).lower()
+        self._by_id[post["id"]] = post
+        # Parsed once; created_at stays an ISO string for responses
+        self._created_epoch[post["id"]] = datetime.fromisoformat(post["created_at"]).timestamp()
+        submolt_posts = self._by_submolt[submolt_name]
+        if front:
+            submolt_posts.insert(0, post)
+        else:
+            submolt_posts.append(post)
+
+    def add_post(self, post: dict) -> None:
+        """Add a new post to the front of the feed and index it."""
+        self.posts.insert(0, post)
+        self._index_post(post, front=True)
+        self._invalidate_caches()
+
+    def vote(self, post_id: str, field: str) -> bool:
+        """Add a vote to a post.
+
+        Args:
+            post_id: ID of the post to vote on
+            field: Vote counter to increment ('upvotes' or 'downvotes')
+
+        Returns:
+            True if the post exists
+        """
+        post = self._by_id.get(post_id)
+        if post is None:
+            return False
+        if not isinstance(post, dict):
+            post = self._thaw_post(post)
+        post[field] = post.get(field, 0) + 1
+        self._invalidate_caches()
+        return True
+
+    def add_submolt(self, submolt: dict) -> bool:
+        """Add a submolt unless one with the same name exists.
+
+        Args:
+            submolt: Submolt to add (must have a 'name')
+
+        Returns:
+            True if the submolt was added, False if the name is taken
+        """
+        if submolt["name"] in self._submolts_by_name:
+            return False
+        self.submolts.append(submolt)
+        self._submolts_by_name[submolt["name"]] = submolt
+        return True
+
+    def add_comment(self, post_id: str, comment: dict) -> None:
+        """Add a comment to a post and index it by ID."""
+        self.comments.setdefault(post_id, []).append(comment)
+        self._comments_by_id[comment["id"]] = comment
+
+    def upvote_comment(self, comment_id: str) -> bool:
+        """Add an upvote to a comment.
+
+        Args:
+            comment_id: ID of the comment to upvote
+
+        Returns:
+            True if the comment exists
+        """
+        comment = self._comments_by_id.get(comment_id)
+        if comment is None:
+            return False
+        comment["upvotes"] = comment.get("upvotes", 0) + 1
+        return True
+
+    def _invalidate_caches(self) -> None:
+        """Drop cached feeds and search results after a post or vote."""
+        self._feed_cache.clear()
+        self._search_cache.clear()
+
+    def _thaw_post(self, post: Mapping[str, Any]) -> dict:
+        """Replace a shared read-only seed post with a private mutable copy.
+
+        Args:
+            post: Indexed seed post
+
+        Returns:
+            The mutable copy, now referenced by every index in place of the seed post
+        """
+        thawed = dict(post)
+        self.posts[self.posts.index(post)] = thawed
+        submolt_posts = self._by_submolt[self._submolt_name(post)]
+        submolt_posts[submolt_posts.index(post)] = thawed
+        self._by_id[thawed["id"]] = thawed
+        return thawed
+
+    def feed(self, sort: str, limit: int, submolt_name: str | None = None) -> list[Mapping[str, Any]]:
+        """Get the first posts of the global or a submolt feed under a sort order.
+
+        Ranks all posts but only selects the top `limit`. Results are cached
+        until the next post or vote, since the agent re-reads the same feeds.
+
+        Args:
+            sort: Sort order ('hot', 'new', 'top'; anything else keeps feed order)
+            limit: Maximum number of posts to return
+            submolt_name: Submolt to restrict the feed to, or None for all posts
+
+        Returns:
+            Up to `limit` posts, best first
+        """
+        cache_key = (submolt_name, sort, limit)
+        cached = self._feed_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        posts = self.posts if submolt_name is None else self._by_submolt.get(submolt_name, [])
+        created = self._created_epoch
+        if sort == "hot":
+            ranked = heapq.nlargest(limit, posts, key=lambda p: _hot_score(p, created[p["id"]]))
+        elif sort == "new":
+            ranked = heapq.nlargest(limit, posts, key=lambda p: created[p["id"]])
+        elif sort == "top":
+            ranked = heapq.nlargest(limit, posts, key=itemgetter("upvotes"))
+        else:
+            ranked = posts[:limit]
+        self._feed_cache[cache_key] = ranked
+        return ranked
+
+    def search_posts(self, query: str, limit: int) -> list[Mapping[str, Any]]:
+        """Find posts whose title, content, or submolt name contains the query.
+
+        Results are cached until the next post or vote, like feeds.
+
+        Args:
+            query: Case-insensitive substring to look for
+            limit: Maximum number of posts to return
+
+        Returns:
+            Matching posts in feed order
+        """
+        query_lower = query.lower()
+        cache_key = (query_lower, limit)
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        search_text = self._search_text
+        # Stop scanning once `limit` matches are found
+        results = list(itertools.islice((p for p in self.posts if query_lower in search_text[p["id"]]), limit))
+        if len(self._search_cache) >= _SEARCH_CACHE_SIZE:
+            # Queries are open-ended, so evict the oldest entry
+            del self._search_cache[next(iter(self._search_cache))]
+        self._search_cache[cache_key] = results
+        return results
 
 
 # =============================================================================
@@ -345,8 +698,11 @@ class MoltbookMetadata(BaseModel):
     """Metadata for Moltbook tool operations.
 
     Implements Addable protocol for aggregation across multiple calls.
+    Instances are immutable (and hashable); __add__ always returns a new one.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     num_uses: int = 1
     posts_created: int = 0
     comments_added: int = 0
@@ -375,6 +731,116 @@ class MoltbookMetadata(BaseModel):
         )
 
 
+# =============================================================================
+# HTTP Request Functions
+# =============================================================================
+
+
+@_http_retry
+async def _fetch_feed(http_client: httpx.AsyncClient, base_url: str, sort: str, limit: int) -> dict:
+    response = await http_client.get(
+        f"{base_url}/feed",
+        params={"sort": sort, "limit": limit},
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+@_http_retry
+async def _create_post(http_client: httpx.AsyncClient, base_url: str, title: str, content: str, submolt: str) -> dict:
+    response = await http_client.post(
+        f"{base_url}/posts",
+        json={"title": title, "content": content, "submolt": submolt},
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+@_http_retry
+async def _fetch_post_with_comments(http_client: httpx.AsyncClient, base_url: str, post_id: str) -> dict:
+    # Comments are returned as part of the single post endpoint
+    response = await http_client.get(f"{base_url}/posts/{post_id}")
+    response.raise_for_status()
+    return response.json()
+
+
+@_http_retry
+async def _add_comment(http_client: httpx.AsyncClient, base_url: str, post_id: str, content: str) -> dict:
+    response = await http_client.post(
+        f"{base_url}/posts/{post_id}/comments",
+        json={"content": content},
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+@_http_retry
+async def _upvote(http_client: httpx.AsyncClient, base_url: str, post_id: str) -> dict:
+    response = await http_client.post(f"{base_url}/posts/{post_id}/upvote")
+    response.raise_for_status()
+    return response.json()
+
+
+@_http_retry
+async def _search(http_client: httpx.AsyncClient, base_url: str, query: str, limit: int) -> dict:
+    response = await http_client.get(
+        f"{base_url}/search",
+        params={"q": query, "limit": limit},
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+@_http_retry
+async def _create_submolt(http_client: httpx.AsyncClient, base_url: str, name: str, description: str) -> dict:
+    response = await http_client.post(
+        f"{base_url}/submolts",
+        json={"name": name, "description": description},
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+@_http_retry
+async def _fetch_submolt_feed(
+    http_client: httpx.AsyncClient, base_url: str, submolt: str, sort: str, limit: int
+) -> dict:
+    response = await http_client.get(
+        f"{base_url}/submolts/{submolt}/feed",
+        params={"sort": sort, "limit": limit},
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+@_http_retry
+async def _downvote(http_client: httpx.AsyncClient, base_url: str, post_id: str) -> dict:
+    response = await http_client.post(f"{base_url}/posts/{post_id}/downvote")
+    response.raise_for_status()
+    return response.json()
+
+
+@_http_retry
+async def _upvote_comment(http_client: httpx.AsyncClient, base_url: str, comment_id: str) -> dict:
+    response = await http_client.post(f"{base_url}/comments/{comment_id}/upvote")
+    response.raise_for_status()
+    return response.json()
+
+
+@_http_retry
+async def _follow_agent(http_client: httpx.AsyncClient, base_url: str, agent_name: str) -> dict:
+    response = await http_client.post(f"{base_url}/agents/{agent_name}/follow")
+    response.raise_for_status()
+    return response.json()
+
+
+@_http_retry
+async def _unfollow_agent(http_client: httpx.AsyncClient, base_url: str, agent_name: str) -> dict:
+    response = await http_client.delete(f"{base_url}/agents/{agent_name}/follow")
+    response.raise_for_status()
+    return response.json()
+
+
 # =============================================================================
 # Tool Factory Functions
 # =============================================================================
@@ -388,20 +854,6 @@ def _get_feed_tool(
 ) -> Tool[MoltbookGetFeedParams, MoltbookMetadata]:
     """Create the Moltbook feed tool."""
 
-    @retry(
-        retry=retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
-    async def _fetch_feed(sort: str, limit: int, http_client: httpx.AsyncClient) -> dict:
-        response = await http_client.get(
-            f"{base_url}/feed",
-            params={"sort": sort, "limit": limit},
-        )
-        response.raise_for_status()
-        return response.json()
-
     async def feed_executor(params: MoltbookGetFeedParams) -> ToolResult[MoltbookMetadata]:
         """Get the Moltbook feed."""
         try:
@@ -409,13 +861,9 @@ def _get_feed_tool(
 
             if mock_mode and mock_state:
                 # Mock feed
-                posts = mock_state.posts[:limit]
-                if params.sort == "new":
-                    posts = sorted(posts, key=lambda x: x["created_at"], reverse=True)
-                elif params.sort == "top":
-                    posts = sorted(posts, key=lambda x: x["upvotes"], reverse=True)
+                posts = mock_state.feed(params.sort, limit)
             elif client:
-                data = await _fetch_feed(params.sort, limit, client)
+                data = await _fetch_feed(client, base_url, params.sort, limit)
                 posts = data.get("posts", [])
             else:
                 return ToolResult(
@@ -424,31 +872,7 @@ def _get_feed_tool(
                     metadata=MoltbookMetadata(feeds_fetched=0),
                 )
 
-            def format_post(p: dict) -> str:
-                # Handle author - can be object with 'name' or string
-                author = p.get("author")
-                if isinstance(author, dict):
-                    author_str = author.get("name") or author.get("id", "")
-                else:
-                    author_str = author or p.get("author_id", "")
-                # Handle submolt - can be object with 'name' or string
-                submolt = p.get("submolt")
-                submolt_str = submolt.get("name", "") if isinstance(submolt, dict) else submolt or ""
-                return (
-                    f"<post>"
-                    f"<post_id>{_safe_escape(p.get('id'))}</post_id>"
-                    f"<author>{_safe_escape(author_str)}</author>"
-                    f"<submolt>{_safe_escape(submolt_str)}</submolt>"
-                    f"<title>{_safe_escape(p.get('title'))}</title>"
-                    f"<content>{_safe_escape(p.get('content'))}</content>"
-                    f"<timestamp>{_safe_escape(p.get('created_at'))}</timestamp>"
-                    f"<upvotes>{p.get('upvotes', 0)}</upvotes>"
-                    f"<downvotes>{p.get('downvotes', 0)}</downvotes>"
-                    f"<comments>{p.get('comment_count', 0)}</comments>"
-                    f"</post>"
-                )
-
-            posts_xml = "\n".join(format_post(p) for p in posts)
+            posts_xml = "\n".join(map(_format_post, posts))
 
             result_xml = f"<moltbook_feed><posts>{posts_xml}</posts></moltbook_feed>"
 
@@ -480,20 +904,6 @@ def _get_create_post_tool(
 ) -> Tool[MoltbookCreatePostParams, MoltbookMetadata]:
     """Create the Moltbook post creation tool."""
 
-    @retry(
-        retry=retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
-    async def _create_post(title: str, content: str, submolt: str, http_client: httpx.AsyncClient) -> dict:
-        response = await http_client.post(
-            f"{base_url}/posts",
-            json={"title": title, "content": content, "submolt": submolt},
-        )
-        response.raise_for_status()
-        return response.json()
-
     async def create_post_executor(params: MoltbookCreatePostParams) -> ToolResult[MoltbookMetadata]:
         """Create a new post on Moltbook."""
         # Check rate limit
@@ -525,7 +935,7 @@ def _get_create_post_tool(
                     "downvotes": 0,
                     "comment_count": 0,
                 }
-                mock_state.posts.insert(0, new_post)
+                mock_state.add_post(new_post)
                 rate_limiter.record_post()
 
                 result_xml = (
@@ -536,7 +946,7 @@ def _get_create_post_tool(
                     f"</moltbook_create_post>"
                 )
             elif client:
-                data = await _create_post(params.title, params.content, params.submolt, client)
+                data = await _create_post(client, base_url, params.title, params.content, params.submolt)
                 rate_limiter.record_post()
                 # API returns id nested inside 'post' object
                 post_data = data.get("post", {})
@@ -582,18 +992,6 @@ def _get_comments_tool(
 ) -> Tool[MoltbookGetCommentsParams, MoltbookMetadata]:
     """Create the Moltbook get comments tool."""
 
-    @retry(
-        retry=retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
-    async def _fetch_post_with_comments(post_id: str, http_client: httpx.AsyncClient) -> dict:
-        # Comments are returned as part of the single post endpoint
-        response = await http_client.get(f"{base_url}/posts/{post_id}")
-        response.raise_for_status()
-        return response.json()
-
     def _format_comment(comment: dict, depth: int = 0) -> str:
         """Format a comment and its replies recursively."""
         # Handle author - can be object with 'name' or null
@@ -629,7 +1027,7 @@ def _get_comments_tool(
                 comments = mock_state.comments.get(params.post_id, [])[:limit]
             elif client:
                 # Comments are included in the single post endpoint response
-                data = await _fetch_post_with_comments(params.post_id, client)
+                data = await _fetch_post_with_comments(client, base_url, params.post_id)
                 comments = data.get("comments", [])[:limit]
             else:
                 return ToolResult(
@@ -669,20 +1067,6 @@ def _get_add_comment_tool(
 ) -> Tool[MoltbookAddCommentParams, MoltbookMetadata]:
     """Create the Moltbook comment tool."""
 
-    @retry(
-        retry=retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
-    async def _add_comment(post_id: str, content: str, http_client: httpx.AsyncClient) -> dict:
-        response = await http_client.post(
-            f"{base_url}/posts/{post_id}/comments",
-            json={"content": content},
-        )
-        response.raise_for_status()
-        return response.json()
-
     async def add_comment_executor(params: MoltbookAddCommentParams) -> ToolResult[MoltbookMetadata]:
         """Add a comment to a Moltbook post."""
         # Check rate limit
@@ -697,10 +1081,9 @@ def _get_add_comment_tool(
         try:
             if mock_mode and mock_state:
                 # Mock comment
-                comment_id = "mc_" + "".join(random.choices(string.ascii_lowercase + string.digits, k=5))
-                if params.post_id not in mock_state.comments:
-                    mock_state.comments[params.post_id] = []
-                mock_state.comments[params.post_id].append(
+                comment_id = mock_state.generate_comment_id()
+                mock_state.add_comment(
+                    params.post_id,
                     {
                         "id": comment_id,
                         "author_id": f"agent_{mock_state.registered_user or 'anonymous'}",
@@ -708,7 +1091,7 @@ def _get_add_comment_tool(
                         "created_at": datetime.now().isoformat() + "Z",
                         "upvotes": 0,
                         "downvotes": 0,
-                    }
+                    },
                 )
                 rate_limiter.record_comment()
 
@@ -720,7 +1103,7 @@ def _get_add_comment_tool(
                     f"</moltbook_add_comment>"
                 )
             elif client:
-                data = await _add_comment(params.post_id, params.content, client)
+                data = await _add_comment(client, base_url, params.post_id, params.content)
                 rate_limiter.record_comment()
                 # API may return id nested inside 'comment' object or at top level
                 comment_data = data.get("comment", data)
@@ -766,17 +1149,6 @@ def _get_upvote_tool(
 ) -> Tool[MoltbookUpvoteParams, MoltbookMetadata]:
     """Create the Moltbook upvote tool."""
 
-    @retry(
-        retry=retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
-    async def _upvote(post_id: str, http_client: httpx.AsyncClient) -> dict:
-        response = await http_client.post(f"{base_url}/posts/{post_id}/upvote")
-        response.raise_for_status()
-        return response.json()
-
     async def upvote_executor(params: MoltbookUpvoteParams) -> ToolResult[MoltbookMetadata]:
         """Upvote a Moltbook post."""
         try:
@@ -789,17 +1161,14 @@ def _get_upvote_tool(
                     )
 
                 # Find and upvote the post
-                for post in mock_state.posts:
-                    if post["id"] == params.post_id:
-                        post["upvotes"] += 1
-                        mock_state.upvoted.add(params.post_id)
-                        break
+                if mock_state.vote(params.post_id, "upvotes"):
+                    mock_state.upvoted.add(params.post_id)
 
                 result_xml = (
                     "<moltbook_upvote><success>true</success><message>Upvote recorded</message></moltbook_upvote>"
                 )
             elif client:
-                data = await _upvote(params.post_id, client)
+                data = await _upvote(client, base_url, params.post_id)
                 result_xml = (
                     f"<moltbook_upvote>"
                     f"<success>true</success>"
@@ -840,44 +1209,16 @@ def _get_search_tool(
 ) -> Tool[MoltbookSearchParams, MoltbookMetadata]:
     """Create the Moltbook search tool."""
 
-    @retry(
-        retry=retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
-    async def _search(query: str, limit: int, http_client: httpx.AsyncClient) -> dict:
-        response = await http_client.get(
-            f"{base_url}/search",
-            params={"q": query, "limit": limit},
-        )
-        response.raise_for_status()
-        return response.json()
-
     async def search_executor(params: MoltbookSearchParams) -> ToolResult[MoltbookMetadata]:
         """Search Moltbook for posts matching a query."""
         try:
             limit = min(params.limit, 50)
-            query_lower = params.query.lower()
 
             if mock_mode and mock_state:
                 # Mock search - simple keyword matching
-                def submolt_name(p: dict) -> str:
-                    submolt = p.get("submolt", {})
-                    if isinstance(submolt, dict):
-                        return submolt.get("name", "")
-                    return str(submolt)
-
-                matching_posts = [
-                    p
-                    for p in mock_state.posts
-                    if query_lower in p["title"].lower()
-                    or query_lower in p["content"].lower()
-                    or query_lower in submolt_name(p).lower()
-                ][:limit]
-                posts = matching_posts
+                posts = mock_state.search_posts(params.query, limit)
             elif client:
-                data = await _search(params.query, limit, client)
+                data = await _search(client, base_url, params.query, limit)
                 posts = data.get("results", [])
             else:
                 return ToolResult(
@@ -886,47 +1227,7 @@ def _get_search_tool(
                     metadata=MoltbookMetadata(searches_performed=0),
                 )
 
-            def _format_search_result(r: dict) -> str:
-                """Format a search result, handling both post and comment types."""
-                result_type = r.get("type", "post")
-                # Handle author - can be object with 'name' or null
-                author = r.get("author")
-                author_str = author.get("name") or author.get("id", "") if isinstance(author, dict) else author or ""
-
-                parts = [
-                    "<result>",
-                    f"<id>{_safe_escape(r.get('id'))}</id>",
-                    f"<type>{_safe_escape(result_type)}</type>",
-                    f"<author>{_safe_escape(author_str)}</author>",
-                ]
-
-                # Include post_id for comments
-                if result_type == "comment" and r.get("post_id"):
-                    parts.append(f"<post_id>{_safe_escape(r.get('post_id'))}</post_id>")
-
-                # Handle submolt for posts
-                if result_type == "post":
-                    submolt = r.get("submolt", {})
-                    submolt_name = submolt.get("name") if isinstance(submolt, dict) else submolt
-                    parts.append(f"<submolt>{_safe_escape(submolt_name)}</submolt>")
-                    parts.append(f"<title>{_safe_escape(r.get('title'))}</title>")
-
-                parts.append(f"<content>{_safe_escape(r.get('content'))}</content>")
-
-                # Include similarity score if present
-                if r.get("similarity") is not None:
-                    parts.append(f"<similarity>{r.get('similarity')}</similarity>")
-
-                # Include vote counts if present (may not be in search results)
-                if r.get("upvotes") is not None:
-                    parts.append(f"<upvotes>{r.get('upvotes', 0)}</upvotes>")
-                if r.get("downvotes") is not None:
-                    parts.append(f"<downvotes>{r.get('downvotes', 0)}</downvotes>")
-
-                parts.append("</result>")
-                return "".join(parts)
-
-            posts_xml = "\n".join(_format_search_result(r) for r in posts)
+            posts_xml = "\n".join(map(_format_search_result, posts))
 
             result_xml = f"<moltbook_search><query>{escape(params.query)}</query><results>{posts_xml}</results></moltbook_search>"
 
@@ -957,38 +1258,18 @@ def _get_create_submolt_tool(
 ) -> Tool[MoltbookCreateSubmoltParams, MoltbookMetadata]:
     """Create the Moltbook submolt creation tool."""
 
-    @retry(
-        retry=retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
-    async def _create_submolt(name: str, description: str, http_client: httpx.AsyncClient) -> dict:
-        response = await http_client.post(
-            f"{base_url}/submolts",
-            json={"name": name, "description": description},
-        )
-        response.raise_for_status()
-        return response.json()
-
     async def create_submolt_executor(params: MoltbookCreateSubmoltParams) -> ToolResult[MoltbookMetadata]:
         """Create a new submolt (community) on Moltbook."""
         try:
             if mock_mode and mock_state:
-                # Check if submolt already exists
-                if any(s["name"] == params.name for s in mock_state.submolts):
+                # Add the submolt unless one with the same name already exists
+                if not mock_state.add_submolt({"name": params.name, "description": params.description}):
                     return ToolResult(
                         content=f"<moltbook_create_submolt><error>Submolt '{params.name}' already exists</error></moltbook_create_submolt>",
                         success=False,
                         metadata=MoltbookMetadata(),
                     )
 
-                mock_state.submolts.append(
-                    {
-                        "name": params.name,
-                        "description": params.description,
-                    }
-                )
                 result_xml = (
                     f"<moltbook_create_submolt>"
                     f"<success>true</success>"
@@ -997,7 +1278,7 @@ def _get_create_submolt_tool(
                     f"</moltbook_create_submolt>"
                 )
             elif client:
-                data = await _create_submolt(params.name, params.description, client)
+                data = await _create_submolt(client, base_url, params.name, params.description)
                 result_xml = (
                     f"<moltbook_create_submolt>"
                     f"<success>true</success>"
@@ -1039,20 +1320,6 @@ def _get_submolt_feed_tool(
 ) -> Tool[MoltbookGetSubmoltFeedParams, MoltbookMetadata]:
     """Create the Moltbook submolt feed tool."""
 
-    @retry(
-        retry=retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
-    async def _fetch_submolt_feed(submolt: str, sort: str, limit: int, http_client: httpx.AsyncClient) -> dict:
-        response = await http_client.get(
-            f"{base_url}/submolts/{submolt}/feed",
-            params={"sort": sort, "limit": limit},
-        )
-        response.raise_for_status()
-        return response.json()
-
     async def submolt_feed_executor(params: MoltbookGetSubmoltFeedParams) -> ToolResult[MoltbookMetadata]:
         """Get the feed for a specific submolt."""
         try:
@@ -1061,18 +1328,9 @@ def _get_submolt_feed_tool(
 
             if mock_mode and mock_state:
                 # Mock submolt feed - filter posts by submolt
-                posts = [
-                    p
-                    for p in mock_state.posts
-                    if (isinstance(p.get("submolt"), dict) and p["submolt"].get("name") == submolt_name)
-                    or p.get("submolt") == submolt_name
-                ][:limit]
-                if params.sort == "new":
-                    posts = sorted(posts, key=lambda x: x["created_at"], reverse=True)
-                elif params.sort == "top":
-                    posts = sorted(posts, key=lambda x: x["upvotes"], reverse=True)
+                posts = mock_state.feed(params.sort, limit, submolt_name)
             elif client:
-                data = await _fetch_submolt_feed(submolt_name, params.sort, limit, client)
+                data = await _fetch_submolt_feed(client, base_url, submolt_name, params.sort, limit)
                 posts = data.get("posts", [])
             else:
                 return ToolResult(
@@ -1081,27 +1339,7 @@ def _get_submolt_feed_tool(
                     metadata=MoltbookMetadata(feeds_fetched=0),
                 )
 
-            def format_submolt_post(p: dict) -> str:
-                # Handle author - can be object with 'name' or string
-                author = p.get("author")
-                if isinstance(author, dict):
-                    author_str = author.get("name") or author.get("id", "")
-                else:
-                    author_str = author or p.get("author_id", "")
-                return (
-                    f"<post>"
-                    f"<post_id>{_safe_escape(p.get('id'))}</post_id>"
-                    f"<author>{_safe_escape(author_str)}</author>"
-                    f"<title>{_safe_escape(p.get('title'))}</title>"
-                    f"<content>{_safe_escape(p.get('content'))}</content>"
-                    f"<timestamp>{_safe_escape(p.get('created_at'))}</timestamp>"
-                    f"<upvotes>{p.get('upvotes', 0)}</upvotes>"
-                    f"<downvotes>{p.get('downvotes', 0)}</downvotes>"
-                    f"<comments>{p.get('comment_count', 0)}</comments>"
-                    f"</post>"
-                )
-
-            posts_xml = "\n".join(format_submolt_post(p) for p in posts)
+            posts_xml = "\n".join(map(_format_submolt_post, posts))
 
             result_xml = f"<moltbook_submolt_feed><submolt>{escape(submolt_name)}</submolt><posts>{posts_xml}</posts></moltbook_submolt_feed>"
 
@@ -1132,32 +1370,18 @@ def _get_downvote_tool(
 ) -> Tool[MoltbookDownvoteParams, MoltbookMetadata]:
     """Create the Moltbook downvote tool."""
 
-    @retry(
-        retry=retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
-    async def _downvote(post_id: str, http_client: httpx.AsyncClient) -> dict:
-        response = await http_client.post(f"{base_url}/posts/{post_id}/downvote")
-        response.raise_for_status()
-        return response.json()
-
     async def downvote_executor(params: MoltbookDownvoteParams) -> ToolResult[MoltbookMetadata]:
         """Downvote a Moltbook post."""
         try:
             if mock_mode and mock_state:
                 # Find and downvote the post
-                for post in mock_state.posts:
-                    if post["id"] == params.post_id:
-                        post["downvotes"] = post.get("downvotes", 0) + 1
-                        break
+                mock_state.vote(params.post_id, "downvotes")
 
                 result_xml = (
                     "<moltbook_downvote><success>true</success><message>Downvote recorded</message></moltbook_downvote>"
                 )
             elif client:
-                data = await _downvote(params.post_id, client)
+                data = await _downvote(client, base_url, params.post_id)
                 result_xml = (
                     f"<moltbook_downvote>"
                     f"<success>true</success>"
@@ -1198,27 +1422,12 @@ def _get_upvote_comment_tool(
 ) -> Tool[MoltbookUpvoteCommentParams, MoltbookMetadata]:
     """Create the Moltbook comment upvote tool."""
 
-    @retry(
-        retry=retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
-    async def _upvote_comment(comment_id: str, http_client: httpx.AsyncClient) -> dict:
-        response = await http_client.post(f"{base_url}/comments/{comment_id}/upvote")
-        response.raise_for_status()
-        return response.json()
-
     async def upvote_comment_executor(params: MoltbookUpvoteCommentParams) -> ToolResult[MoltbookMetadata]:
         """Upvote a comment on Moltbook."""
         try:
             if mock_mode and mock_state:
-                # Find and upvote the comment in mock state
-                for comments in mock_state.comments.values():
-                    for comment in comments:
-                        if comment["id"] == params.comment_id:
-                            comment["upvotes"] = comment.get("upvotes", 0) + 1
-                            break
+                # Upvote the comment in mock state
+                mock_state.upvote_comment(params.comment_id)
 
                 result_xml = (
                     "<moltbook_upvote_comment>"
@@ -1227,7 +1436,7 @@ def _get_upvote_comment_tool(
                     "</moltbook_upvote_comment>"
                 )
             elif client:
-                data = await _upvote_comment(params.comment_id, client)
+                data = await _upvote_comment(client, base_url, params.comment_id)
                 result_xml = (
                     f"<moltbook_upvote_comment>"
                     f"<success>true</success>"
@@ -1268,17 +1477,6 @@ def _get_follow_agent_tool(
 ) -> Tool[MoltbookFollowAgentParams, MoltbookMetadata]:
     """Create the Moltbook follow agent tool."""
 
-    @retry(
-        retry=retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
-    async def _follow_agent(agent_name: str, http_client: httpx.AsyncClient) -> dict:
-        response = await http_client.post(f"{base_url}/agents/{agent_name}/follow")
-        response.raise_for_status()
-        return response.json()
-
     async def follow_agent_executor(params: MoltbookFollowAgentParams) -> ToolResult[MoltbookMetadata]:
         """Follow an agent on Moltbook."""
         try:
@@ -1291,7 +1489,7 @@ def _get_follow_agent_tool(
                     f"</moltbook_follow_agent>"
                 )
             elif client:
-                data = await _follow_agent(params.agent_name, client)
+                data = await _follow_agent(client, base_url, params.agent_name)
                 result_xml = (
                     f"<moltbook_follow_agent>"
                     f"<success>true</success>"
@@ -1333,17 +1531,6 @@ def _get_unfollow_agent_tool(
 ) -> Tool[MoltbookUnfollowAgentParams, MoltbookMetadata]:
     """Create the Moltbook unfollow agent tool."""
 
-    @retry(
-        retry=retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
-    async def _unfollow_agent(agent_name: str, http_client: httpx.AsyncClient) -> dict:
-        response = await http_client.delete(f"{base_url}/agents/{agent_name}/follow")
-        response.raise_for_status()
-        return response.json()
-
     async def unfollow_agent_executor(params: MoltbookUnfollowAgentParams) -> ToolResult[MoltbookMetadata]:
         """Unfollow an agent on Moltbook."""
         try:
@@ -1356,7 +1543,7 @@ def _get_unfollow_agent_tool(
                     f"</moltbook_unfollow_agent>"
                 )
             elif client:
-                data = await _unfollow_agent(params.agent_name, client)
+                data = await _unfollow_agent(client, base_url, params.agent_name)
                 result_xml = (
                     f"<moltbook_unfollow_agent>"
                     f"<success>true</success>"
@@ -1429,6 +1616,9 @@ class MoltbookToolProvider(ToolProvider):
         base_url: str = DEFAULT_BASE_URL,
         timeout: float = DEFAULT_TIMEOUT,
         mock_mode: bool = False,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        http2: bool = True,
     ) -> None:
         """Initialize MoltbookToolProvider.
 
@@ -1438,11 +1628,20 @@ class MoltbookToolProvider(ToolProvider):
             base_url: Moltbook API base URL.
             timeout: HTTP timeout in seconds.
             mock_mode: If True, returns simulated responses for development/testing.
+            max_connections: Maximum number of concurrent connections in the HTTP pool.
+            max_keepalive_connections: Maximum number of idle connections kept open for reuse.
+            http2: Multiplex concurrent tool calls over one connection with HTTP/2.
+                   Only takes effect when the h2 package (httpx[http2]) is installed.
         """
         self._api_key = api_key or os.getenv("MOLTBOOK_API_KEY")
         self._base_url = base_url
         self._timeout = timeout
         self._mock_mode = mock_mode
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self._http2 = http2 and h2 is not None
 
         self._client: httpx.AsyncClient | None = None
         self._mock_state: MockMoltbookState | None = None
@@ -1462,6 +1661,9 @@ class MoltbookToolProvider(ToolProvider):
                 timeout=self._timeout,
                 headers=headers,
                 follow_redirects=True,
+                limits=self._limits,
+                http2=self._http2,
+                verify=_ssl_context(),
             )
             await self._client.__aenter__()
 
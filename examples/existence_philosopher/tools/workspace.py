@@ -22,6 +22,9 @@ from pydantic import BaseModel, Field
 
 from stirrup.core.models import Tool, ToolProvider, ToolResult, ToolUseCountMetadata
 
+from ..fs import ensure_dir
+from ..state_store import shared_state_store
+
 __all__ = ["WorkspaceToolProvider"]
 
 
@@ -106,25 +109,28 @@ class WorkspaceToolProvider(ToolProvider):
                           and perspectives/ subdirectory.
         """
         self._workspace = Path(workspace_dir).resolve()
-        self._state_file = self._workspace / "state.json"
+        # Shared with the Ralph loop and every other provider on this workspace.
+        # Sync tools run in worker threads, possibly for several concurrent
+        # iterations, so writes hold the store's process-wide lock.
+        self._store = shared_state_store(self._workspace)
         self._perspectives_dir = self._workspace / "perspectives"
 
     async def __aenter__(self) -> list[Tool[Any, Any]]:
         """Enter async context: ensure workspace structure exists."""
-        self._workspace.mkdir(parents=True, exist_ok=True)
-        self._perspectives_dir.mkdir(exist_ok=True)
+        ensure_dir(self._perspectives_dir)
 
         # Initialize state file if it doesn't exist
-        if not self._state_file.exists():
-            initial_state = {
-                "iteration": 0,
-                "perspectives": [],
-                "explored_posts": [],
-                "explored_submolts": [],
-                "conversations_since_last_report": 0,
-                "last_report_iteration": 0,
-            }
-            self._state_file.write_text(json.dumps(initial_state, indent=2))
+        with self._store.lock:
+            if not self._store.exists():
+                initial_state = {
+                    "iteration": 0,
+                    "perspectives": [],
+                    "explored_posts": [],
+                    "explored_submolts": [],
+                    "conversations_since_last_report": 0,
+                    "last_report_iteration": 0,
+                }
+                self._store.compact(initial_state)
 
         return self.get_tools()
 
@@ -134,18 +140,15 @@ class WorkspaceToolProvider(ToolProvider):
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
-        """Exit async context: no cleanup needed."""
-        pass
+        """Exit async context (the shared state store stays open for other users)."""
 
     def _read_state(self) -> dict[str, Any]:
-        """Read current state from state.json."""
-        if self._state_file.exists():
-            return json.loads(self._state_file.read_text())
-        return {}
+        """Read current state (snapshot plus WAL)."""
+        return self._store.load()
 
-    def _write_state(self, state: dict[str, Any]) -> None:
-        """Write state to state.json."""
-        self._state_file.write_text(json.dumps(state, indent=2))
+    def _update_state(self, updates: dict[str, Any]) -> None:
+        """Append field updates to the state WAL."""
+        self._store.update(updates)
 
     def _get_next_perspective_id(self) -> str:
         """Get the next available perspective ID."""
@@ -203,9 +206,7 @@ class WorkspaceToolProvider(ToolProvider):
 
         def executor(params: UpdateStateParams) -> ToolResult[ToolUseCountMetadata]:
             try:
-                state = self._read_state()
-                state.update(params.updates)
-                self._write_state(state)
+                self._update_state(params.updates)
                 return ToolResult(
                     content=f"<success>State updated with: {list(params.updates.keys())}</success>",
                     metadata=ToolUseCountMetadata(),
@@ -229,46 +230,42 @@ class WorkspaceToolProvider(ToolProvider):
 
         def executor(params: SavePerspectiveParams) -> ToolResult[ToolUseCountMetadata]:
             try:
-                # Check for duplicate post_id
-                for path in self._perspectives_dir.glob("perspective_*.json"):
-                    existing = json.loads(path.read_text())
-                    if existing.get("post_id") == params.post_id:
-                        return ToolResult(
-                            content=f"<error>Perspective for post {params.post_id} already exists as {path.stem}</error>",
-                            success=False,
-                            metadata=ToolUseCountMetadata(),
-                        )
-
-                # Generate ID and save
-                perspective_id = self._get_next_perspective_id()
-                perspective = {
-                    "id": perspective_id,
-                    "post_id": params.post_id,
-                    "author": params.author,
-                    "submolt": params.submolt,
-                    "timestamp": params.timestamp,
-                    "direct_quote": params.direct_quote,
-                    "key_ideas": params.key_ideas,
-                    "unique_angle": params.unique_angle,
-                    "thread_context": params.thread_context,
-                    "upvotes": params.upvotes,
-                    "downvotes": params.downvotes,
-                    "collected_at": datetime.now().isoformat(),
-                }
-
-                path = self._perspectives_dir / f"{perspective_id}.json"
-                path.write_text(json.dumps(perspective, indent=2))
-
-                # Update state
-                state = self._read_state()
-                if "perspectives" not in state:
-                    state["perspectives"] = []
-                state["perspectives"].append(perspective_id)
-                if "explored_posts" not in state:
-                    state["explored_posts"] = []
-                if params.post_id not in state["explored_posts"]:
-                    state["explored_posts"].append(params.post_id)
-                self._write_state(state)
+                # Hold the lock across the duplicate check, ID allocation, file
+                # write and state append so concurrent saves can't share an ID
+                with self._store.lock:
+                    # Check for duplicate post_id
+                    for path in self._perspectives_dir.glob("perspective_*.json"):
+                        existing = json.loads(path.read_text())
+                        if existing.get("post_id") == params.post_id:
+                            return ToolResult(
+                                content=f"<error>Perspective for post {params.post_id} already exists as {path.stem}</error>",
+                                success=False,
+                                metadata=ToolUseCountMetadata(),
+                            )
+
+                    # Generate ID and save
+                    perspective_id = self._get_next_perspective_id()
+                    perspective = {
+                        "id": perspective_id,
+                        "post_id": params.post_id,
+                        "author": params.author,
+                        "submolt": params.submolt,
+                        "timestamp": params.timestamp,
+                        "direct_quote": params.direct_quote,
+                        "key_ideas": params.key_ideas,
+                        "unique_angle": params.unique_angle,
+                        "thread_context": params.thread_context,
+                        "upvotes": params.upvotes,
+                        "downvotes": params.downvotes,
+                        "collected_at": datetime.now().isoformat(),
+                    }
+
+                    path = self._perspectives_dir / f"{perspective_id}.json"
+                    path.write_text(json.dumps(perspective, indent=2))
+
+                    # Update state: log just the new items, not the whole lists
+                    self._store.append("perspectives", perspective_id, unique=True)
+                    self._store.append("explored_posts", params.post_id, unique=True)
 
                 return ToolResult(
                     content=f"<success>Saved perspective {perspective_id} from {params.author} (post: {params.post_id})</success>",
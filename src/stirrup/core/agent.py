@@ -10,7 +10,7 @@ from dataclasses import dataclass, field
 from itertools import chain, takewhile
 from pathlib import Path
 from types import TracebackType
-from typing import Annotated, Any, Self
+from typing import Annotated, Any, Self, cast
 
 import anyio
 from pydantic import BaseModel, Field, ValidationError
@@ -183,6 +183,7 @@ class Agent[FinishParams: BaseModel, FinishMeta]:
         context_summarization_cutoff: float = CONTEXT_SUMMARIZATION_CUTOFF,
         turns_remaining_warning_threshold: int = TURNS_REMAINING_WARNING_THRESHOLD,
         run_sync_in_thread: bool = True,
+        max_concurrent_tool_calls: int = 1,
         text_only_tool_responses: bool = True,
         # Logging
         logger: AgentLoggerBase | None = None,
@@ -202,6 +203,8 @@ class Agent[FinishParams: BaseModel, FinishMeta]:
             finish_tool: Tool used to signal task completion. Defaults to SIMPLE_FINISH_TOOL.
             context_summarization_cutoff: Fraction of context window (0-1) at which to trigger summarization
             run_sync_in_thread: Execute synchronous tool executors in a separate thread
+            max_concurrent_tool_calls: Maximum number of tool calls from a single assistant message
+                                       to execute concurrently. Defaults to 1 (sequential execution).
             text_only_tool_responses: Extract images from tool responses as separate user messages
             logger: Optional logger instance. If None, creates AgentLogger() internally.
 
@@ -223,6 +226,7 @@ class Agent[FinishParams: BaseModel, FinishMeta]:
         self._context_summarization_cutoff = context_summarization_cutoff
         self._turns_remaining_warning_threshold = turns_remaining_warning_threshold
         self._run_sync_in_thread = run_sync_in_thread
+        self._max_concurrent_tool_calls = max_concurrent_tool_calls
         self._text_only_tool_responses = text_only_tool_responses
 
         # Logger (can be passed in or created here)
@@ -869,6 +873,51 @@ class Agent[FinishParams: BaseModel, FinishMeta]:
             success=result.success,
         )
 
+    async def _run_tools_concurrently(
+        self,
+        tool_calls: list[ToolCall],
+        run_metadata: dict[str, list[Any]],
+    ) -> list[ToolMessage]:
+        """Execute tool calls concurrently, bounded by max_concurrent_tool_calls.
+
+        Finish tool calls run only after every other call has completed, so
+        they never race the work they report on. Metadata is recorded in tool
+        call order, as sequential execution would record it.
+
+        Returns the tool messages in the same order as the tool calls.
+        """
+        results: list[ToolMessage | None] = [None] * len(tool_calls)
+        call_metadata: list[dict[str, list[Any]]] = [{} for _ in tool_calls]
+        limiter = anyio.CapacityLimiter(self._max_concurrent_tool_calls)
+
+        async def run_one(index: int, tool_call: ToolCall) -> None:
+            async with limiter:
+                results[index] = await self.run_tool(tool_call, call_metadata[index])
+
+        try:
+            async with anyio.create_task_group() as task_group:
+                for index, tool_call in enumerate(tool_calls):
+                    if tool_call.name != FINISH_TOOL_NAME:
+                        task_group.start_soon(run_one, index, tool_call)
+        except BaseExceptionGroup as group:
+            # Raise the first tool error itself, as sequential execution would,
+            # so callers catching specific exception types keep working
+            error = group.exceptions[0]
+            while isinstance(error, BaseExceptionGroup):
+                error = error.exceptions[0]
+            raise error from None
+
+        for index, tool_call in enumerate(tool_calls):
+            if tool_call.name == FINISH_TOOL_NAME:
+                results[index] = await self.run_tool(tool_call, call_metadata[index])
+
+        for metadata in call_metadata:
+            for name, items in metadata.items():
+                run_metadata.setdefault(name, []).extend(items)
+
+        # Every slot is filled once all calls have run without error
+        return cast(list[ToolMessage], results)
+
     async def step(
         self,
         messages: list[ChatMessage],
@@ -897,9 +946,16 @@ class Agent[FinishParams: BaseModel, FinishMeta]:
         tool_messages: list[ToolMessage] = []
         if assistant_message.tool_calls:
             tool_messages = []
-            for tool_call in assistant_message.tool_calls:
-                tool_message = await self.run_tool(tool_call, run_metadata)
-                tool_messages.append(tool_message)
+            concurrent = self._max_concurrent_tool_calls > 1 and len(assistant_message.tool_calls) > 1
+            if concurrent:
+                tool_messages = await self._run_tools_concurrently(assistant_message.tool_calls, run_metadata)
+
+            for index, tool_call in enumerate(assistant_message.tool_calls):
+                if concurrent:
+                    tool_message = tool_messages[index]
+                else:
+                    tool_message = await self.run_tool(tool_call, run_metadata)
+                    tool_messages.append(tool_message)
 
                 if tool_message.success and tool_message.name == FINISH_TOOL_NAME:
                     finish_params = self._finish_tool.parameters.model_validate_json(tool_call.arguments)
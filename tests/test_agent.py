@@ -1,5 +1,7 @@
 """Tests for agent core functionality."""
 
+import anyio
+import pytest
 from pydantic import BaseModel
 
 from stirrup.constants import FINISH_TOOL_NAME
@@ -208,6 +210,213 @@ async def test_agent_tool_execution() -> None:
     assert "Echo: Hello" in echo_messages[0].content
 
 
+async def test_agent_concurrent_tool_execution() -> None:
+    """Test agent runs tool calls from one message concurrently and keeps their order."""
+
+    class EmptyParams(BaseModel):
+        pass
+
+    released = anyio.Event()
+
+    async def wait_executor(params: EmptyParams) -> ToolResult:  # noqa: ARG001
+        await released.wait()
+        return ToolResult(content="waited")
+
+    async def release_executor(params: EmptyParams) -> ToolResult:  # noqa: ARG001
+        released.set()
+        return ToolResult(content="released")
+
+    wait_tool = Tool[EmptyParams, None](
+        name="wait",
+        description="Wait until released",
+        parameters=EmptyParams,
+        executor=wait_executor,  # ty: ignore[invalid-argument-type]
+    )
+    release_tool = Tool[EmptyParams, None](
+        name="release",
+        description="Release waiters",
+        parameters=EmptyParams,
+        executor=release_executor,  # ty: ignore[invalid-argument-type]
+    )
+
+    responses = [
+        # First turn: the wait call can only complete if release runs alongside it
+        AssistantMessage(
+            content="Running both",
+            tool_calls=[
+                ToolCall(name="wait", arguments="{}", tool_call_id="call_1"),
+                ToolCall(name="release", arguments="{}", tool_call_id="call_2"),
+            ],
+            token_usage=TokenUsage(input=100, output=50),
+        ),
+        AssistantMessage(
+            content="Done",
+            tool_calls=[
+                ToolCall(
+                    name=FINISH_TOOL_NAME,
+                    arguments='{"reason": "Both ran", "paths": []}',
+                    tool_call_id="call_3",
+                )
+            ],
+            token_usage=TokenUsage(input=100, output=50),
+        ),
+    ]
+
+    client = MockLLMClient(responses)
+    agent = Agent(
+        client=client,
+        name="test-agent",
+        max_turns=5,
+        tools=[wait_tool, release_tool],
+        finish_tool=SIMPLE_FINISH_TOOL,
+        max_concurrent_tool_calls=2,
+    )
+
+    with anyio.fail_after(5):
+        async with agent.session() as session:
+            finish_params, message_history, _ = await session.run(
+                [
+                    SystemMessage(content="Test system message"),
+                    UserMessage(content="Run both tools"),
+                ]
+            )
+
+    assert finish_params is not None
+    messages = message_history[0]
+    tool_messages: list[ToolMessage] = [m for m in messages if isinstance(m, ToolMessage)]
+    # Results are recorded in tool call order, not completion order
+    assert [m.name for m in tool_messages] == ["wait", "release", FINISH_TOOL_NAME]
+    assert tool_messages[0].content == "waited"
+
+
+async def test_agent_concurrent_tools_finish_last() -> None:
+    """Test a finish call waits for its sibling calls and metadata keeps tool call order."""
+
+    class RecordParams(BaseModel):
+        label: str
+        delay: float
+
+    events: list[str] = []
+
+    async def record_executor(params: RecordParams) -> ToolResult[str]:
+        await anyio.sleep(params.delay)
+        events.append(params.label)
+        return ToolResult(content=params.label, metadata=params.label)
+
+    async def finish_executor(params: FinishParams) -> ToolResult[str]:
+        events.append("finish")
+        return ToolResult(content=params.reason, metadata="finish")
+
+    record_tool = Tool[RecordParams, str](
+        name="record",
+        description="Record a label after a delay",
+        parameters=RecordParams,
+        executor=record_executor,  # ty: ignore[invalid-argument-type]
+    )
+    finish_tool = Tool[FinishParams, str](
+        name=FINISH_TOOL_NAME,
+        description="Finish",
+        parameters=FinishParams,
+        executor=finish_executor,  # ty: ignore[invalid-argument-type]
+    )
+
+    responses = [
+        AssistantMessage(
+            content="Record and finish",
+            tool_calls=[
+                ToolCall(name="record", arguments='{"label": "slow", "delay": 0.05}', tool_call_id="call_1"),
+                ToolCall(
+                    name=FINISH_TOOL_NAME,
+                    arguments='{"reason": "Recorded", "paths": []}',
+                    tool_call_id="call_2",
+                ),
+                ToolCall(name="record", arguments='{"label": "fast", "delay": 0}', tool_call_id="call_3"),
+            ],
+            token_usage=TokenUsage(input=100, output=50),
+        ),
+    ]
+
+    client = MockLLMClient(responses)
+    agent = Agent(
+        client=client,
+        name="test-agent",
+        max_turns=5,
+        tools=[record_tool],
+        finish_tool=finish_tool,
+        max_concurrent_tool_calls=3,
+    )
+
+    with anyio.fail_after(5):
+        async with agent.session() as session:
+            finish_params, _, run_metadata = await session.run(
+                [
+                    SystemMessage(content="Test system message"),
+                    UserMessage(content="Record and finish"),
+                ]
+            )
+
+    assert finish_params is not None
+    assert events == ["fast", "slow", "finish"]
+    # Metadata follows tool call order, not completion order
+    assert run_metadata["record"] == ["slow", "fast"]
+
+
+async def test_agent_concurrent_tool_error_propagates() -> None:
+    """Test a tool error raised during concurrent execution surfaces as the original exception."""
+
+    class EmptyParams(BaseModel):
+        pass
+
+    async def ok_executor(params: EmptyParams) -> ToolResult:  # noqa: ARG001
+        return ToolResult(content="ok")
+
+    async def failing_executor(params: EmptyParams) -> ToolResult:  # noqa: ARG001
+        raise RuntimeError("tool failed")
+
+    ok_tool = Tool[EmptyParams, None](
+        name="ok",
+        description="Succeed",
+        parameters=EmptyParams,
+        executor=ok_executor,  # ty: ignore[invalid-argument-type]
+    )
+    failing_tool = Tool[EmptyParams, None](
+        name="fail",
+        description="Fail",
+        parameters=EmptyParams,
+        executor=failing_executor,  # ty: ignore[invalid-argument-type]
+    )
+
+    responses = [
+        AssistantMessage(
+            content="Running both",
+            tool_calls=[
+                ToolCall(name="ok", arguments="{}", tool_call_id="call_1"),
+                ToolCall(name="fail", arguments="{}", tool_call_id="call_2"),
+            ],
+            token_usage=TokenUsage(input=100, output=50),
+        ),
+    ]
+
+    client = MockLLMClient(responses)
+    agent = Agent(
+        client=client,
+        name="test-agent",
+        max_turns=5,
+        tools=[ok_tool, failing_tool],
+        finish_tool=SIMPLE_FINISH_TOOL,
+        max_concurrent_tool_calls=2,
+    )
+
+    with pytest.raises(RuntimeError, match="tool failed"):
+        async with agent.session() as session:
+            await session.run(
+                [
+                    SystemMessage(content="Test system message"),
+                    UserMessage(content="Run both tools"),
+                ]
+            )
+
+
 async def test_agent_invalid_tool_call() -> None:
     """Test agent handles invalid tool calls gracefully."""
     # Create mock responses